@@ -1,5 +1,7 @@
 """FastAPI application using hexagonal architecture."""
 
+import logging
+
 from fastapi import FastAPI, Query, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -8,6 +10,8 @@ from backend.internal.container import container
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    logging.basicConfig(level=logging.INFO)
+
     app = FastAPI(
         title="VoiceBot API",
         description="API for streaming audio responses from the VoiceBot using Hexagonal Architecture"
@@ -6,8 +6,9 @@ project_root = os.path.join(os.path.dirname(__file__), '..', '..')
 sys.path.append(project_root)
 
 from backend.internal.adapters.driven.all_mpnet_base_v2 import AllMPNetBaseV2
+from backend.internal.adapters.driven.cached_embedding_calculator import CachedEmbeddingCalculator
 from backend.internal.adapters.driven.postgres_db import PostgresVectorDB
-from backend.internal.adapters.driven.markdown_parser_impl import MarkdownParserImpl
+from backend.internal.adapters.driven.markdown_parser_adapter import MarkdownParserAdapter
 from backend.internal.application.markdown_scraper_service import MarkdownScraperService
 
 
@@ -21,9 +22,10 @@ def main():
     try:
         # Set up dependencies following the same pattern as the container
         print("1. Setting up dependencies...")
-        embedding_calculator = AllMPNetBaseV2()
+        model = AllMPNetBaseV2()
+        embedding_calculator = CachedEmbeddingCalculator(model, model.MODEL_NAME, model.precision)
         vector_db = PostgresVectorDB(embedding_calculator)
-        markdown_parser = MarkdownParserImpl()
+        markdown_parser = MarkdownParserAdapter()
 
         # Create the markdown scraper service
         scraper_service = MarkdownScraperService(markdown_parser, vector_db)
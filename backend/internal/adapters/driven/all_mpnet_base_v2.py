@@ -1,19 +1,32 @@
+from typing import List
+
+import torch
 from sentence_transformers import SentenceTransformer
-from functools import lru_cache
 
 from backend.internal.ports.output.embedding_calculator import EmbeddingCalculator
+import numpy as np
 from numpy import ndarray
 
 
 class AllMPNetBaseV2(EmbeddingCalculator):
+    MODEL_NAME: str = "all-mpnet-base-v2"
+    BATCH_SIZE: int = 64
+
     _instance = None
     _model = None
+    # Precision the model computes in, embeddings of different precisions differ slightly
+    precision: str = "float32"
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             print("🧠 Loading sentence transformer model (one-time initialization)...")
-            cls._model = SentenceTransformer("all-mpnet-base-v2")
+            if torch.cuda.is_available():
+                # Half precision halves memory traffic and uses the tensor cores on the GPU
+                cls._model = SentenceTransformer(cls.MODEL_NAME, device="cuda").half()
+                cls.precision = "float16"
+            else:
+                cls._model = SentenceTransformer(cls.MODEL_NAME)
             print("✅ Model loaded successfully")
         return cls._instance
 
@@ -21,6 +34,15 @@ class AllMPNetBaseV2(EmbeddingCalculator):
         # Prevent re-initialization
         pass
 
-    @lru_cache(maxsize=128)
     def calculate_embeddings(self, text: str) -> ndarray:
-        return self._model.encode(text, normalize_embeddings=True)
+        # Contiguous float32 (also for the FP16 GPU model), binds to pgvector and hashes without conversion
+        # Repeated texts are served by CachedEmbeddingCalculator in front of the model
+        return np.ascontiguousarray(
+            self._model.encode(text, normalize_embeddings=True, convert_to_numpy=True), dtype=np.float32
+        )
+
+    def calculate_embeddings_batch(self, texts: List[str]) -> ndarray:
+        return np.ascontiguousarray(
+            self._model.encode(texts, batch_size=self.BATCH_SIZE, normalize_embeddings=True, convert_to_numpy=True),
+            dtype=np.float32
+        )
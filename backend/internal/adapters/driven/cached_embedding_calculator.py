@@ -0,0 +1,128 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from backend.internal.ports.output.embedding_calculator import EmbeddingCalculator
+
+
+class CachedEmbeddingCalculator(EmbeddingCalculator):
+    """Embedding calculator decorator with an in-memory and a persistent, content-addressed cache."""
+
+    DEFAULT_CACHE_PATH: str = ".embedcache.sqlite3"
+    DEFAULT_TTL_SECONDS: int = 30 * 86400
+    # Number of embeddings kept in memory in front of the persistent cache
+    MEMORY_CACHE_SIZE: int = 1024
+    # Minimum time between two purges of expired rows from the persistent cache
+    PURGE_INTERVAL_SECONDS: int = 3600
+
+    def __init__(self, embedding_calculator: EmbeddingCalculator, model_name: str, precision: str,
+                 cache_path: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.embedding_calculator = embedding_calculator
+        self.model_name = model_name
+        self.precision = precision
+        self.ttl_seconds = ttl_seconds
+
+        cache_path = cache_path or os.getenv('EMBEDDING_CACHE_PATH', self.DEFAULT_CACHE_PATH)
+        self._lock = threading.Lock()
+        # Recently used embeddings by content address, least recently used first
+        self._memory_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._last_purge: float = 0.0
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("""
+                           CREATE TABLE IF NOT EXISTS embeddings
+                           (
+                               key        TEXT PRIMARY KEY,
+                               embedding  BLOB NOT NULL,
+                               created_at REAL NOT NULL
+                           )
+                           """)
+        self._conn.commit()
+        self._purge_expired()
+
+    def _cache_key(self, text: str) -> str:
+        """Content address of a text for the configured model and precision."""
+        return hashlib.blake2b(f"{self.model_name}\x00{self.precision}\x00{text}".encode('utf-8'),
+                               digest_size=32).hexdigest()
+
+    def _purge_expired(self) -> None:
+        """Delete expired embeddings from the persistent cache."""
+        with self._lock:
+            self._last_purge = time.time()
+            self._conn.execute("DELETE FROM embeddings WHERE created_at < ?", (self._last_purge - self.ttl_seconds,))
+            self._conn.commit()
+
+    def _remember(self, key: str, embeddings: np.ndarray) -> None:
+        """Keep an embedding in memory, evicting the least recently used one when full."""
+        # Every hit hands out the same array, make sure no caller can modify it
+        embeddings.setflags(write=False)
+        with self._lock:
+            self._memory_cache[key] = embeddings
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        """Load a cached embedding that has not expired yet, from memory before the persistent cache."""
+        with self._lock:
+            embeddings = self._memory_cache.get(key)
+            if embeddings is not None:
+                self._memory_cache.move_to_end(key)
+                return embeddings
+
+            row = self._conn.execute(
+                "SELECT embedding FROM embeddings WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        if row is None:
+            return None
+        embeddings = np.frombuffer(row[0], dtype=np.float32)
+        self._remember(key, embeddings)
+        return embeddings
+
+    def _store(self, entries: List[Tuple[str, np.ndarray]]) -> None:
+        """Store embeddings under their content addresses in memory and in one transaction."""
+        for key, embeddings in entries:
+            self._remember(key, embeddings)
+
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, created_at) VALUES (?, ?, ?)",
+                [(key, embeddings.tobytes(), now) for key, embeddings in entries]
+            )
+            self._conn.commit()
+
+        if now - self._last_purge >= self.PURGE_INTERVAL_SECONDS:
+            self._purge_expired()
+
+    def calculate_embeddings(self, text: str) -> np.ndarray:
+        key = self._cache_key(text)
+        embeddings = self._load(key)
+        if embeddings is None:
+            embeddings = np.asarray(self.embedding_calculator.calculate_embeddings(text), dtype=np.float32)
+            self._store([(key, embeddings)])
+        return embeddings
+
+    def calculate_embeddings_batch(self, texts: List[str]) -> np.ndarray:
+        keys = [self._cache_key(text) for text in texts]
+        embeddings = [self._load(key) for key in keys]
+
+        # Only compute the cache misses, in a single batch
+        missing = [i for i, cached in enumerate(embeddings) if cached is None]
+        if missing:
+            computed = self.embedding_calculator.calculate_embeddings_batch([texts[i] for i in missing])
+            computed = np.asarray(computed, dtype=np.float32)
+            for i, row in zip(missing, computed):
+                # Copied, so a cached row does not keep the whole batch alive
+                embeddings[i] = row.copy()
+            self._store([(keys[i], embeddings[i]) for i in missing])
+
+        if not embeddings:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(embeddings)
@@ -1,7 +1,9 @@
-from typing import AsyncGenerator
+import logging
+from typing import AsyncGenerator, Optional
 
 from dotenv import load_dotenv
 from google import genai
+from google.genai import types
 
 from backend.internal.ports.output.llm_port import LLMPort
 
@@ -9,22 +11,49 @@ from backend.internal.ports.output.llm_port import LLMPort
 class GeminiLLMAdapter(LLMPort):
     """Adapter for Google Gemini LLM service."""
 
-    def __init__(self):
+    MODEL: str = "gemini-2.0-flash"
+    HTTP_TIMEOUT_MS: int = 30_000
+
+    _client = None
+
+    def __init__(self, system_instruction: Optional[str] = None):
         load_dotenv()
-        self.client = genai.Client()
+
+        # Share one client and its keep-alive HTTP connection pool across instances (singleton pattern)
+        if GeminiLLMAdapter._client is None:
+            GeminiLLMAdapter._client = genai.Client(
+                http_options=types.HttpOptions(timeout=self.HTTP_TIMEOUT_MS)
+            )
+        self.client = GeminiLLMAdapter._client
+        self.system_instruction = system_instruction
+        self.logger = logging.getLogger(__name__)
+
+        # The system instruction is far below the minimum size of an explicit context cache, it is
+        # sent with every request as an identical prefix that Gemini's implicit caching can reuse
+        self._generation_config: Optional[types.GenerateContentConfig] = (
+            types.GenerateContentConfig(system_instruction=system_instruction) if system_instruction else None
+        )
 
     async def generate_response_stream(self, prompt: str) -> AsyncGenerator[str, None]:
         """Generate a streaming text response using Gemini LLM."""
         try:
-            stream = self.client.models.generate_content_stream(
-                model="gemini-2.0-flash",
-                contents=prompt
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.MODEL,
+                contents=prompt,
+                config=self._generation_config
             )
 
-            for chunk in stream:
+            usage = None
+            async for chunk in stream:
+                if chunk.usage_metadata:
+                    usage = chunk.usage_metadata
                 if chunk.text:
                     yield chunk.text
 
+            if usage:
+                self.logger.debug("Gemini prompt tokens: %s (cached: %s)",
+                                  usage.prompt_token_count, usage.cached_content_token_count or 0)
+
         except Exception as e:
-            print(f"❌ Error in Gemini streaming text generation: {e}")
+            self.logger.error("Error in Gemini streaming text generation: %s", e)
             raise RuntimeError(f"LLM streaming text generation failed: {str(e)}")
@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Dict
 
 import numpy as np
 from google.cloud import speech
@@ -7,24 +9,32 @@ from google.cloud import speech
 from backend.internal.domain.models.audio_transcription import AudioTranscription
 from backend.internal.ports.output.speech_recognition_port import SpeechRecognitionPort
 
+# Per thread scratch buffers for the PCM conversion, grown on demand and reused across calls
+_scratch = threading.local()
+
 
 class GoogleSpeechAdapter(SpeechRecognitionPort):
     """Adapter for Google Cloud Speech-to-Text service."""
 
+    # Audio of at least this many bytes (1 s of 48 kHz LINEAR16) is streamed instead of sent in one request
+    STREAMING_MIN_AUDIO_BYTES: int = 96000
+    # Streamed audio is sent in slices of 100 ms
+    STREAMING_CHUNK_BYTES: int = 9600
+    # Deadline of a recognition RPC, the blocking call in the executor is aborted by gRPC afterwards
+    RECOGNITION_TIMEOUT_SECONDS: float = 10.0
+
     def __init__(self):
         self.client = speech.SpeechClient()
-        logging.basicConfig(level=logging.INFO)
+        # Configs by language code, they are never mutated
+        self._recognition_configs: Dict[str, speech.RecognitionConfig] = {}
+        self._streaming_configs: Dict[str, speech.StreamingRecognitionConfig] = {}
         self.logger = logging.getLogger(__name__)
 
-    async def transcribe_audio(self, audio_data: np.ndarray, language_code: str = "de-DE") -> AudioTranscription:
-        """Transcribe audio data using Google Cloud Speech-to-Text."""
-        try:
-            # Convert PCM numpy array to 16-bit PCM bytes
-            # Ensure audio is in the correct range [-1, 1] and convert to int16
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
-
-            config = speech.RecognitionConfig(
+    def _recognition_config(self, language_code: str) -> speech.RecognitionConfig:
+        """Get the recognition config, it only depends on the language and is built once."""
+        config = self._recognition_configs.get(language_code)
+        if config is None:
+            config = self._recognition_configs[language_code] = speech.RecognitionConfig(
                 encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
                 sample_rate_hertz=48000,
                 language_code=language_code,
@@ -34,20 +44,74 @@ class GoogleSpeechAdapter(SpeechRecognitionPort):
                 max_alternatives=1,
                 use_enhanced=True,
             )
+        return config
+
+    def _streaming_config(self, language_code: str) -> speech.StreamingRecognitionConfig:
+        """Get the streaming recognition config around the cached recognition config."""
+        config = self._streaming_configs.get(language_code)
+        if config is None:
+            config = self._streaming_configs[language_code] = speech.StreamingRecognitionConfig(
+                config=self._recognition_config(language_code),
+                interim_results=False,
+            )
+        return config
 
+    def _recognize(self, audio_bytes: bytes, language_code: str) -> list:
+        """Recognize the audio, returning the recognition results.
+
+        Longer audio is streamed in slices so the upload overlaps with recognition,
+        short audio is sent in a single request where the stream setup would dominate.
+        """
+        if len(audio_bytes) < self.STREAMING_MIN_AUDIO_BYTES:
             audio = speech.RecognitionAudio(content=audio_bytes)
-            response = self.client.recognize(config=config, audio=audio)
-
-            # Process the response
-            transcription_text = ""
-            confidence = 0.0
-
-            if response.results:
-                for result in response.results:
-                    if result.alternatives:
-                        transcription_text = result.alternatives[0].transcript.strip()
-                        confidence = result.alternatives[0].confidence if result.alternatives[0].confidence else 0.0
-                        break  # Take the first (best) result
+            response = self.client.recognize(config=self._recognition_config(language_code), audio=audio,
+                                             timeout=self.RECOGNITION_TIMEOUT_SECONDS)
+            return list(response.results)
+
+        requests = (
+            speech.StreamingRecognizeRequest(audio_content=audio_bytes[start:start + self.STREAMING_CHUNK_BYTES])
+            for start in range(0, len(audio_bytes), self.STREAMING_CHUNK_BYTES)
+        )
+        responses = self.client.streaming_recognize(config=self._streaming_config(language_code), requests=requests,
+                                                    timeout=self.RECOGNITION_TIMEOUT_SECONDS)
+        return [result for response in responses for result in response.results]
+
+    @staticmethod
+    def _to_pcm16_bytes(audio_data: np.ndarray) -> bytes:
+        """Convert audio in the range [-1, 1] to little-endian 16-bit PCM bytes.
+
+        Clipping, scaling and casting run in reused scratch buffers, so the returned
+        bytes are the only allocation proportional to the audio length.
+        """
+        # No-op for the float32 audio the port expects, other input is converted once
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32).reshape(-1)
+        size = audio_data.size
+        samples = getattr(_scratch, 'samples', None)
+        if samples is None or samples.size < size:
+            samples = _scratch.samples = np.empty(size, dtype=np.float32)
+            _scratch.pcm = np.empty(size, dtype='<i2')
+
+        scaled = samples[:size]
+        np.clip(audio_data, -1.0, 1.0, out=scaled)
+        scaled *= 32767
+        pcm = _scratch.pcm[:size]
+        np.copyto(pcm, scaled, casting='unsafe')
+        return pcm.tobytes()
+
+    async def transcribe_audio(self, audio_data: np.ndarray, language_code: str = "de-DE") -> AudioTranscription:
+        """Transcribe audio data using Google Cloud Speech-to-Text."""
+        try:
+            # Convert PCM numpy array to 16-bit PCM bytes
+            audio_bytes = self._to_pcm16_bytes(audio_data)
+
+            # The blocking recognition runs in the default executor, keeping the event loop free
+            results = await asyncio.to_thread(self._recognize, audio_bytes, language_code)
+
+            # Take the best alternative of the first result
+            alternatives = results[0].alternatives if results else None
+            best = alternatives[0] if alternatives else None
+            transcription_text = best.transcript.strip() if best else ""
+            confidence = (best.confidence or 0.0) if best else 0.0
 
             self.logger.info(f"Transcription completed: '{transcription_text}' (confidence: {confidence:.2f})")
 
@@ -1,171 +1,204 @@
-from typing import AsyncGenerator, Any
+import asyncio
+import logging
+import re
+from typing import AsyncGenerator, Dict, Optional
 
-import numpy as np
 from google.cloud import texttospeech
 
 from backend.internal.ports.output.tts_port import TTSPort
 
+_SENTENCE_END_PUNCTUATION = frozenset('.!?')
+_BREAK_PATTERN = re.compile(r'[.!?,;:]')
+
 
 class GoogleTTSAdapter(TTSPort):
     """Adapter for Google Cloud Text-to-Speech service."""
 
+    # Audio responses are coalesced into chunks of at least this many bytes
+    MIN_AUDIO_CHUNK_BYTES: int = 4096
+
     def __init__(self, language_code: str = "de-DE"):
-        self.client = texttospeech.TextToSpeechClient()
+        self._client: Optional[texttospeech.TextToSpeechAsyncClient] = None
         self.language_code = language_code
+        # Config requests opening a synthesis stream by voice, they are never mutated
+        self._config_requests: Dict[str, texttospeech.StreamingSynthesizeRequest] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def client(self) -> texttospeech.TextToSpeechAsyncClient:
+        """Async gRPC client, created lazily because its channel binds to the running event loop."""
+        if self._client is None:
+            self._client = texttospeech.TextToSpeechAsyncClient()
+        return self._client
 
     async def synthesize_speech_stream(self, text_stream: AsyncGenerator[str, None],
-                                       voice: str) -> AsyncGenerator[tuple[Any, str] | tuple[Any, str], None]:
-        """Synthesize speech from streaming text using Google Cloud TTS."""
+                                       voice: str) -> AsyncGenerator[tuple[bytes, str], None]:
+        """Synthesize speech from streaming text using Google Cloud TTS.
+
+        All text of a turn is sent over a single streaming_synthesize call. Each audio chunk is
+        labelled with the text submitted to synthesis since the previous chunk, or "" if none.
+        The text is sent ahead of synthesis, so a label reports each text part exactly once but
+        is not a transcript of its chunk's audio.
+        """
         try:
-            # Create streaming config with the specified voice
-            streaming_config = texttospeech.StreamingSynthesizeConfig(
-                voice=texttospeech.VoiceSelectionParams(
-                    name=voice,
-                    language_code=self.language_code,
-                )
-            )
-
-            sentence_buffer = ""
-
-            async for text_chunk in text_stream:
-                if text_chunk:
-                    # Check if this chunk contains only punctuation
-                    is_punctuation_only = self._is_punctuation_only_chunk(text_chunk)
-
-                    sentence_buffer += text_chunk
-
-                    # Check if we should synthesize
-                    should_synthesize = (
-                            self._is_sentence_complete(sentence_buffer) or
-                            self._has_natural_break(sentence_buffer) or
-                            self._should_break_at_word_boundary(sentence_buffer)
-                    )
-
-                    if should_synthesize and sentence_buffer.strip():
-                        # Find the best break point to avoid splitting words
-                        text_to_synthesize = self._get_text_to_synthesize(sentence_buffer)
-
-                        if text_to_synthesize:
-                            try:
-                                async for audio_chunk in self._synthesize_text(text_to_synthesize, streaming_config):
-                                    yield audio_chunk.astype(np.int16).tolist(), text_to_synthesize
-
-                                # Remove the synthesized text from buffer
-                                sentence_buffer = sentence_buffer[(len(text_to_synthesize) + 1):].lstrip()
-
-                                # If the current chunk was punctuation-only, we need to continue synthesis
-                                # with the punctuation chunk but without the punctuation to avoid duplication
-                                if is_punctuation_only and self._is_sentence_end_punctuation(text_chunk.strip()):
-                                    chunk_without_punctuation = self._remove_punctuation(text_chunk).strip()
-                                    if chunk_without_punctuation:
-                                        # If there's content after removing punctuation, synthesize it
-                                        try:
-                                            async for audio_chunk in self._synthesize_text(
-                                                    chunk_without_punctuation, streaming_config):
-                                                yield audio_chunk.astype(
-                                                    np.int16).tolist(), chunk_without_punctuation
-                                        except Exception as e:
-                                            print(f"❌ Error synthesizing punctuation continuation: {e}")
-                                    else:
-                                        try:
-                                            # Use a very short pause or silence to continue the stream
-                                            async for audio_chunk in self._synthesize_text(" ", streaming_config):
-                                                yield audio_chunk.astype(np.int16).tolist(), " "
-                                        except Exception as e:
-                                            print(f"❌ Error synthesizing punctuation continuation: {e}")
-
-                            except Exception as e:
-                                print(f"❌ Error synthesizing text chunk: {e}")
-                                sentence_buffer = ""
-
-            # Synthesize any remaining text
-            if sentence_buffer.strip():
+            texts = self._split_text_stream(text_stream)
+            # Only open the synthesis stream once there is text to synthesize
+            first_text = await anext(texts, None)
+            if first_text is None:
+                return
+
+            # Requests of the open synthesis stream, None closes the stream
+            requests: asyncio.Queue = asyncio.Queue()
+            requests.put_nowait(self._config_request(voice))
+            requests.put_nowait(texttospeech.StreamingSynthesizeRequest(
+                input=texttospeech.StreamingSynthesisInput(text=first_text)))
+            pending_texts = [first_text]
+
+            async def feed_text():
+                """Send the remaining text parts over the open synthesis stream."""
                 try:
-                    async for audio_chunk in self._synthesize_text(sentence_buffer.strip(), streaming_config):
-                        yield audio_chunk.astype(np.int16).tolist(), sentence_buffer.strip()
-                except Exception as e:
-                    print(f"❌ Error synthesizing final text: {e}")
+                    async for text in texts:
+                        pending_texts.append(text)
+                        requests.put_nowait(texttospeech.StreamingSynthesizeRequest(
+                            input=texttospeech.StreamingSynthesisInput(text=text)))
+                finally:
+                    requests.put_nowait(None)
+
+            feed_task = asyncio.create_task(feed_text())
+            try:
+                async for audio_chunk in self._synthesize_stream(requests):
+                    label = " ".join(pending_texts)
+                    pending_texts.clear()
+                    yield audio_chunk, label
+
+                # Surface errors of the text stream
+                await feed_task
+            finally:
+                feed_task.cancel()
+                requests.put_nowait(None)
 
         except Exception as e:
-            print(f"❌ Error in Google TTS streaming synthesis: {e}")
+            self.logger.error("Error in Google TTS streaming synthesis: %s", e)
             raise RuntimeError(f"TTS streaming synthesis failed: {str(e)}")
 
-    @staticmethod
-    def _is_sentence_complete(text: str) -> bool:
-        """Check if the text contains a complete sentence."""
-        return any(punct in text for punct in ['.', '!', '?'])
+    def _config_request(self, voice: str) -> texttospeech.StreamingSynthesizeRequest:
+        """Get the config request opening a synthesis stream, it is built once per voice."""
+        request = self._config_requests.get(voice)
+        if request is None:
+            request = self._config_requests[voice] = texttospeech.StreamingSynthesizeRequest(
+                streaming_config=texttospeech.StreamingSynthesizeConfig(
+                    voice=texttospeech.VoiceSelectionParams(
+                        name=voice,
+                        language_code=self.language_code,
+                    )
+                )
+            )
+        return request
+
+    async def _split_text_stream(self, text_stream: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+        """Split streamed text at sentence ends, natural breaks or word boundaries of long text."""
+        # Buffered text parts, only joined when text is split off
+        buffer_parts: list[str] = []
+        buffer_length = 0
+        # End offsets of the last sentence end and natural break in the buffer (0 if none)
+        sentence_end = natural_break = 0
+
+        async for text_chunk in text_stream:
+            if not text_chunk:
+                continue
+
+            # Only the new chunk is scanned, its offsets are shifted behind the buffered text
+            sentence_end, natural_break = self._scan_breaks(text_chunk, buffer_length, sentence_end, natural_break)
+            buffer_parts.append(text_chunk)
+            buffer_length += len(text_chunk)
+
+            # Prefer complete sentences, then natural breaks, then word boundaries of long text
+            split_position = sentence_end or natural_break
+            if not split_position and self._should_break_at_word_boundary(buffer_length, text_chunk):
+                split_position = buffer_length
+            if not split_position:
+                continue
+
+            sentence_buffer = "".join(buffer_parts)
+            text_to_synthesize = sentence_buffer[:split_position].strip()
+            if text_to_synthesize:
+                yield text_to_synthesize
+
+                # Keep the remainder as a single part, it is short and rescanned
+                remainder = sentence_buffer[split_position:].lstrip()
+                buffer_parts = [remainder] if remainder else []
+                buffer_length = len(remainder)
+                sentence_end, natural_break = self._scan_breaks(remainder, 0, 0, 0)
+            else:
+                buffer_parts = [sentence_buffer]
+
+        # Synthesize any remaining text
+        remaining_text = "".join(buffer_parts).strip()
+        if remaining_text:
+            yield remaining_text
 
     @staticmethod
-    def _has_natural_break(text: str) -> bool:
-        """Check if the text has a natural break point."""
-        return any(punct in text for punct in [',', ';', ':'])
+    def _scan_breaks(text: str, offset: int, sentence_end: int, natural_break: int) -> tuple[int, int]:
+        """Update the end offsets of the last sentence end and natural break with text starting at offset."""
+        for match in _BREAK_PATTERN.finditer(text):
+            if match.group() in _SENTENCE_END_PUNCTUATION:
+                sentence_end = offset + match.end()
+            else:
+                natural_break = offset + match.end()
+        return sentence_end, natural_break
 
     @staticmethod
-    def _should_break_at_word_boundary(text: str) -> bool:
+    def _should_break_at_word_boundary(buffer_length: int, last_chunk: str) -> bool:
         """Check if we should break at a word boundary (for long text)."""
-        return len(text) > 100 and text.endswith(' ')
+        return buffer_length > 100 and last_chunk.endswith(' ')
 
     @staticmethod
-    def _is_punctuation_only_chunk(text: str) -> bool:
-        """Check if the text chunk contains only punctuation and whitespace."""
-        stripped = text.strip()
-        if not stripped:
-            return False
-        # Check if all characters are punctuation
-        return all(c in '.!?,:;' for c in stripped)
-
-    @staticmethod
-    def _is_sentence_end_punctuation(text: str) -> bool:
-        """Check if the text contains sentence-ending punctuation."""
-        return any(punct in text for punct in ['.', '!', '?'])
-
-    @staticmethod
-    def _remove_punctuation(text: str) -> str:
-        """Remove punctuation from text."""
-        result = text
-        for punct in '.!?,:;':
-            result = result.replace(punct, '')
-        return result
+    def _take_whole_samples(buffer: bytearray) -> bytes:
+        """Remove the whole int16 samples from the reused buffer, keeping an odd trailing byte.
+
+        The samples are copied exactly once through a memoryview instead of slicing the
+        bytearray and copying the slice again.
+        """
+        size = len(buffer) - len(buffer) % 2
+        with memoryview(buffer) as view:
+            samples = view[:size].tobytes()
+        del buffer[:size]
+        return samples
+
+    async def _synthesize_stream(self, requests: asyncio.Queue) -> AsyncGenerator[bytes, None]:
+        """Run one streaming synthesis over the queued requests, yielding raw LINEAR16 audio bytes."""
+
+        async def request_generator():
+            while (request := await requests.get()) is not None:
+                yield request
+
+        response_stream = None
+        audio_buffer = bytearray()
+        try:
+            response_stream = await self.client.streaming_synthesize(requests=request_generator())
+            async for response in response_stream:
+                audio_content = response.audio_content
+                if not audio_content:
+                    continue
 
-    @staticmethod
-    def _get_text_to_synthesize(text: str) -> str:
-        """Get the portion of text that should be synthesized."""
-        # Find the last complete sentence or natural break
-        for punct in ['.', '!', '?']:
-            if punct in text:
-                idx = text.rfind(punct)
-                return text[:idx + 1].strip()
-
-        # If no sentence end, look for natural breaks
-        for punct in [',', ';', ':']:
-            if punct in text:
-                idx = text.rfind(punct)
-                return text[:idx + 1].strip()
-
-        # If text is long enough, break at word boundary
-        if len(text) > 100:
-            words = text.split()
-            if len(words) > 1:
-                return ' '.join(words[:-1]) + ' '
-
-        return text.strip()
-
-    async def _synthesize_text(self, text: str, streaming_config) -> AsyncGenerator[np.ndarray, None]:
-        """Synthesize a single text chunk using streaming TTS."""
-
-        def request_generator():
-            yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
-            yield texttospeech.StreamingSynthesizeRequest(input=texttospeech.StreamingSynthesisInput(text=text))
+                # Large, sample aligned responses are passed through without copying
+                if not audio_buffer and len(audio_content) >= self.MIN_AUDIO_CHUNK_BYTES \
+                        and len(audio_content) % 2 == 0:
+                    yield audio_content
+                    continue
 
-        try:
-            response_stream = self.client.streaming_synthesize(request_generator())
+                audio_buffer.extend(audio_content)
+                if len(audio_buffer) >= self.MIN_AUDIO_CHUNK_BYTES:
+                    yield self._take_whole_samples(audio_buffer)
 
-            for response in response_stream:
-                if response.audio_content:
-                    # Convert audio bytes to numpy array
-                    audio_data = np.frombuffer(response.audio_content, dtype=np.int16)
-                    yield audio_data
+            if len(audio_buffer) >= 2:
+                yield self._take_whole_samples(audio_buffer)
 
         except Exception as e:
-            print(f"❌ Error in streaming synthesis: {e}")
+            self.logger.error("Error in streaming synthesis: %s", e)
             raise
+
+        finally:
+            # Abort the RPC if the consumer stopped early
+            if response_stream is not None and not response_stream.done():
+                response_stream.cancel()
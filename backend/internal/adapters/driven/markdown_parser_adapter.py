@@ -4,6 +4,17 @@ from typing import List
 from backend.internal.domain.models.markdown_document import MarkdownDocument, MarkdownTextSection
 from backend.internal.ports.output.markdown_parser import MarkdownParser
 
+# Headline lines: one to six # characters followed by whitespace and text
+_HEADLINE_LINE_PATTERN = re.compile(r'^[^\S\n]*#{1,6}[^\S\n]+\S.*$', re.MULTILINE)
+# Lines that are entirely an image, link, HTML comment, horizontal rule, code block marker
+# or table separator, removed including their line break
+_SKIP_LINE_PATTERN = re.compile(
+    r'^[^\S\n]*(?:!\[.*\]\(.*\)|\[.*\]\(.*\)|<!--.*-->|-{3,}|\*{3,}|_{3,}|```.*|\|(?=.*-).*\|)[^\S\n]*(?:\n|\Z)',
+    re.MULTILINE
+)
+# Line breaks enclosing one or more empty or whitespace only lines
+_BLANK_LINES_PATTERN = re.compile(r'\n(?:[^\S\n]*\n)+')
+
 
 class MarkdownParserAdapter(MarkdownParser):
     """Implementation of markdown parser that extracts text sections while ignoring headlines."""
@@ -38,89 +49,14 @@ class MarkdownParserAdapter(MarkdownParser):
         )
 
     def extract_text_sections(self, content: str) -> List[str]:
-        """Extract only the text sections from markdown content, ignoring headlines."""
-        # Split content into lines
-        lines = content.split('\n')
-
-        text_sections = []
-        current_section = []
-
-        for line in lines:
-            stripped_line = line.strip()
-
-            # Skip empty lines
-            if not stripped_line:
-                # If we have accumulated text, add it as a section
-                if current_section:
-                    section_text = '\n'.join(current_section).strip()
-                    if section_text:  # Only add non-empty sections
-                        text_sections.append(section_text)
-                    current_section = []
-                continue
-
-            # Check if line is a headline (starts with #)
-            if self._is_headline(stripped_line):
-                # If we have accumulated text, add it as a section before the headline
-                if current_section:
-                    section_text = '\n'.join(current_section).strip()
-                    if section_text:  # Only add non-empty sections
-                        text_sections.append(section_text)
-                    current_section = []
-                # Skip the headline itself
-                continue
-
-            # Check if line is a special markdown element to skip
-            if self._should_skip_line(stripped_line):
-                continue
-
-            # This is regular text content, add to current section
-            current_section.append(line)
-
-        # Add any remaining text as the last section
-        if current_section:
-            section_text = '\n'.join(current_section).strip()
-            if section_text:  # Only add non-empty sections
-                text_sections.append(section_text)
-
-        return text_sections
-
-    def _is_headline(self, line: str) -> bool:
-        """Check if a line is a markdown headline."""
-        # Headlines start with one or more # characters followed by a space
-        return re.match(r'^#{1,6}\s+', line) is not None
-
-    def _should_skip_line(self, line: str) -> bool:
-        """Check if a line should be skipped (special markdown elements)."""
-        # Skip lines that are:
-        # - Image references: ![alt](url)
-        # - Link-only lines: [text](url)
-        # - HTML comments: <!-- -->
-        # - Horizontal rules: --- or ***
-        # - Code block markers: ```
-        # - Table separators: |---|---|
-
-        # Image references
-        if re.match(r'^\!\[.*\]\(.*\)$', line):
-            return True
-
-        # Standalone links (entire line is just a link)
-        if re.match(r'^\[.*\]\(.*\)$', line):
-            return True
-
-        # HTML comments
-        if re.match(r'^<!--.*-->$', line):
-            return True
-
-        # Horizontal rules
-        if re.match(r'^(-{3,}|\*{3,}|_{3,})$', line):
-            return True
-
-        # Code block markers
-        if re.match(r'^```', line):
-            return True
+        """Extract only the text sections from markdown content, ignoring headlines.
 
-        # Table separators
-        if re.match(r'^\|.*\|$', line) and '-' in line:
-            return True
+        Sections are separated by empty lines and headlines, special markdown elements are
+        dropped without ending a section. All line handling runs inside the regex engine.
+        """
+        # Headlines end a section, so they are emptied rather than removed
+        content = _HEADLINE_LINE_PATTERN.sub('', content)
+        content = _SKIP_LINE_PATTERN.sub('', content)
 
-        return False
+        sections = (section.strip() for section in _BLANK_LINES_PATTERN.split(content))
+        return [section for section in sections if section]
@@ -1,19 +1,28 @@
+import io
 import os
-from typing import List
-from functools import lru_cache
-import hashlib
+import struct
+import weakref
+from contextlib import contextmanager
+from typing import List, Optional
 
 import numpy as np
 import psycopg2
-from psycopg2 import pool
+from psycopg2 import errors, pool
 from dotenv import load_dotenv
+from pgvector.psycopg2 import register_vector
 
 from backend.internal.ports.output.embedding_calculator import EmbeddingCalculator
 from backend.internal.ports.output.vector_database import VectorDatabase
 
 
 class PostgresVectorDB(VectorDatabase):
+    # Candidate list size of HNSW index scans, trades recall for search latency
+    HNSW_EF_SEARCH: int = 40
+
     _connection_pool = None
+    # Pooled connections on which the search statement has been prepared, closed or replaced
+    # connections drop out once the pool releases them
+    _prepared_connections = weakref.WeakSet()
 
     def __init__(self, embedding_calculator: EmbeddingCalculator, min_similarity: float = 0.5):
         super().__init__(embedding_calculator, min_similarity)
@@ -44,77 +53,184 @@ class PostgresVectorDB(VectorDatabase):
         """Return connection to pool"""
         PostgresVectorDB._connection_pool.putconn(conn)
 
-    def create_table(self) -> None:
-        """Create a table to store documents."""
+    @contextmanager
+    def _connection(self):
+        """Borrow an autocommit connection from the pool, returning it even if the block fails"""
         conn = self._get_connection()
         try:
             conn.autocommit = True
-            cursor = conn.cursor()
+            yield conn
+        finally:
+            self._put_connection(conn)
+
+    def create_table(self) -> None:
+        """Create the document and semantic response cache tables with HNSW indexes for nearest neighbour search.
+
+        Embeddings are stored as half precision (halfvec, pgvector 0.7+), halving the bytes
+        scanned per distance computation. Tables from older versions are migrated in place.
+        Extension updates and index changes only run when the schema actually differs, so a
+        regular startup takes no exclusive locks and never rebuilds an index.
+        """
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute("""
                            CREATE EXTENSION IF NOT EXISTS vector;
+                           DO $$
+                           BEGIN
+                               IF to_regtype('halfvec') IS NULL THEN
+                                   ALTER EXTENSION vector UPDATE;
+                               END IF;
+                           END $$;
                            CREATE TABLE IF NOT EXISTS documents
                            (
                                id        SERIAL PRIMARY KEY,
                                content   TEXT,
-                               embedding VECTOR(768)
+                               embedding HALFVEC(768)
+                           );
+                           CREATE TABLE IF NOT EXISTS semantic_cache
+                           (
+                               id              SERIAL PRIMARY KEY,
+                               query_embedding HALFVEC(768) NOT NULL,
+                               response        TEXT         NOT NULL,
+                               created_at      TIMESTAMPTZ  NOT NULL DEFAULT now()
                            );
+                           DO $$
+                           BEGIN
+                               IF (SELECT format_type(atttypid, atttypmod)
+                                   FROM pg_attribute
+                                   WHERE attrelid = 'documents'::regclass
+                                     AND attname = 'embedding') <> 'halfvec(768)' THEN
+                                   DROP INDEX IF EXISTS documents_embedding_hnsw;
+                                   DROP INDEX IF EXISTS documents_embedding_cosine_hnsw;
+                                   ALTER TABLE documents ALTER COLUMN embedding TYPE HALFVEC(768);
+                               END IF;
+                               IF to_regclass('documents_embedding_hnsw') IS NOT NULL THEN
+                                   DROP INDEX documents_embedding_hnsw;
+                               END IF;
+                               IF to_regclass('documents_embedding_cosine_hnsw') IS NULL THEN
+                                   CREATE INDEX documents_embedding_cosine_hnsw
+                                       ON documents USING hnsw (embedding halfvec_cosine_ops)
+                                       WITH (m = 16, ef_construction = 64);
+                               END IF;
+                               IF to_regclass('semantic_cache_query_embedding_hnsw') IS NULL THEN
+                                   CREATE INDEX semantic_cache_query_embedding_hnsw
+                                       ON semantic_cache USING hnsw (query_embedding halfvec_cosine_ops);
+                               END IF;
+                           END $$;
                            """)
-            cursor.close()
-        finally:
-            self._put_connection(conn)
+
+            # Bind numpy arrays as pgvector values and parse vector results on every pooled connection
+            register_vector(conn, globally=True)
 
     def insert_document(self, text: str) -> None:
         """
         Inserts or updates a document with its embedding using connection pool.
         """
-        embeddings = self.embedding_calculator.calculate_embeddings(text)
-        embedding_str = ','.join(map(str, embeddings))
+        embeddings = np.asarray(self.embedding_calculator.calculate_embeddings(text), dtype=np.float32)
 
-        conn = self._get_connection()
-        try:
-            conn.autocommit = True
-            cursor = conn.cursor()
+        with self._connection() as conn, conn.cursor() as cursor:
             cursor.execute("""
                            INSERT INTO documents (content, embedding)
-                           VALUES (%s, %s)
+                           VALUES (%s, %s::halfvec)
                            ON CONFLICT DO NOTHING;
-                           """, (text, f'[{embedding_str}]'))
-            cursor.close()
-        finally:
-            self._put_connection(conn)
+                           """, (text, embeddings))
 
-    @lru_cache(maxsize=64)
-    def _search_cached(self, query_hash: str, query_str: str, top_k: int) -> tuple:
+    def insert_documents(self, texts: List[str]) -> None:
         """
-        Cached search implementation to avoid repeated database queries.
+        Inserts multiple documents with batched embedding calculation, streamed in a single binary COPY.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                           SELECT content, embedding <-> %s AS similarity
+        if not texts:
+            return
+
+        embeddings = self.embedding_calculator.calculate_embeddings_batch(texts)
+
+        with self._connection() as conn, conn.cursor() as cursor:
+            cursor.copy_expert("COPY documents (content, embedding) FROM STDIN WITH (FORMAT BINARY);",
+                               self._copy_rows(texts, embeddings))
+
+    @staticmethod
+    def _copy_rows(texts: List[str], embeddings) -> io.BytesIO:
+        """Encode documents as binary COPY rows of content and halfvec embedding."""
+        buffer = io.BytesIO()
+        buffer.write(b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0))
+        for text, embedding in zip(texts, embeddings):
+            content = text.encode('utf-8')
+            # halfvec binary format: dimensions, unused, big-endian half precision values
+            embedding = np.asarray(embedding, dtype='>f2')
+            buffer.write(struct.pack('>hi', 2, len(content)))
+            buffer.write(content)
+            buffer.write(struct.pack('>iHH', 4 + embedding.nbytes, embedding.size, 0))
+            buffer.write(embedding.tobytes())
+        buffer.write(struct.pack('>h', -1))
+        buffer.seek(0)
+        return buffer
+
+    def _prepare_search(self, conn, cursor) -> None:
+        """Configure the session and prepare the document search statement on a connection."""
+        cursor.execute("SET hnsw.ef_search = %s;", (self.HNSW_EF_SEARCH,))
+        cursor.execute("""
+                       PREPARE search_documents (halfvec, float8, int) AS
+                           SELECT content
                            FROM documents
-                           WHERE embedding <-> %s >= %s
-                           ORDER BY embedding <-> %s
-                           LIMIT %s;
-                           """, (query_str, query_str, self.min_similarity, query_str, top_k))
+                           WHERE embedding <=> $1 <= $2
+                           ORDER BY embedding <=> $1
+                           LIMIT $3;
+                       """)
+        PostgresVectorDB._prepared_connections.add(conn)
+
+    def search(self, query: np.ndarray, top_k: int = 10) -> List[str]:
+        """
+        Retrieves top-k documents most similar to the query vector above the minimum cosine similarity.
+        """
+        query = np.ascontiguousarray(query, dtype=np.float32)
+
+        parameters = (query, 1 - self.min_similarity, top_k)
+        with self._connection() as conn, conn.cursor() as cursor:
+            # Configure, parse and plan the search once per connection, the query vector is bound a single time
+            if conn not in PostgresVectorDB._prepared_connections:
+                self._prepare_search(conn, cursor)
+            try:
+                cursor.execute("EXECUTE search_documents (%s, %s, %s);", parameters)
+            except errors.InvalidSqlStatementName:
+                # The session lost its prepared statement (e.g. after a server side reset), prepare it again
+                self._prepare_search(conn, cursor)
+                cursor.execute("EXECUTE search_documents (%s, %s, %s);", parameters)
 
             results = cursor.fetchall()
-            cursor.close()
-            return tuple(text for text, _ in results)
-        finally:
-            self._put_connection(conn)
 
-    def search(self, query: np.ndarray, top_k: int = 10) -> List[str]:
+        # The connection is back in the pool before the results are unpacked
+        return [text for (text,) in results]
+
+    def search_cached_response(self, query: np.ndarray, min_similarity: float, max_age_seconds: int) -> Optional[str]:
         """
-        Retrieves top-k documents most similar to the query vector with caching.
+        Retrieves the cached response of the most similar, not expired query above the cosine similarity.
         """
-        embedding_str = ','.join(map(str, query))
-        query_str = f'[{embedding_str}]'
+        query = np.ascontiguousarray(query, dtype=np.float32)
+
+        with self._connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                           WITH q AS (SELECT %s::halfvec AS v)
+                           SELECT response
+                           FROM semantic_cache
+                           WHERE query_embedding <=> (SELECT v FROM q) <= %s
+                             AND created_at >= now() - make_interval(secs => %s)
+                           ORDER BY query_embedding <=> (SELECT v FROM q)
+                           LIMIT 1;
+                           """, (query, 1 - min_similarity, max_age_seconds))
 
-        # Create hash for caching
-        query_hash = hashlib.md5(f"{query_str}_{top_k}_{self.min_similarity}".encode()).hexdigest()
+            row = cursor.fetchone()
 
-        # Use cached search
-        cached_results = self._search_cached(query_hash, query_str, top_k)
-        return list(cached_results)
+        return row[0] if row else None
+
+    def insert_cached_response(self, query: np.ndarray, response: str, max_age_seconds: int) -> None:
+        """
+        Caches the response to a query under the query embedding, pruning expired responses.
+        """
+        query = np.ascontiguousarray(query, dtype=np.float32)
+
+        with self._connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                           DELETE FROM semantic_cache
+                           WHERE created_at < now() - make_interval(secs => %s);
+                           INSERT INTO semantic_cache (query_embedding, response)
+                           VALUES (%s::halfvec, %s);
+                           """, (max_age_seconds, query, response))
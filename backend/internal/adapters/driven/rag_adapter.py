@@ -1,4 +1,7 @@
-from typing import List
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -9,31 +12,90 @@ from backend.internal.ports.output.vector_database import VectorDatabase
 
 class RAGAdapter(RAGPort):
     """Adapter for RAG (Retrieval-Augmented Generation) system."""
-    
+
+    # Minimum cosine similarity of a cached query to reuse its response
+    SEMANTIC_CACHE_MIN_SIMILARITY: float = 0.92
+    SEMANTIC_CACHE_MAX_AGE_SECONDS: int = 86400
+    # Number of queries whose retrieved documents are kept
+    RETRIEVAL_CACHE_SIZE: int = 256
+
     def __init__(self, embedding_calculator: EmbeddingCalculator, vector_db: VectorDatabase):
         self.embedding_calculator = embedding_calculator
         self.vector_db = vector_db
-    
+        # Embeddings currently being calculated, concurrent lookups of the same text share them
+        self._pending_embeddings: Dict[str, asyncio.Future] = {}
+        # Retrieved documents by query text and result count, least recently used first
+        self._retrieval_cache: OrderedDict[Tuple[str, int], List[str]] = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """Calculate embeddings off the event loop, at most once at a time per text."""
+        future = self._pending_embeddings.get(text)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(self.embedding_calculator.calculate_embeddings, text))
+            self._pending_embeddings[text] = future
+            future.add_done_callback(lambda _: self._pending_embeddings.pop(text, None))
+        # Shielded, a cancelled caller must not cancel the calculation for the others
+        return await asyncio.shield(future)
+
     async def retrieve_relevant_documents(self, query: str, max_results: int = 5) -> List[str]:
         """Retrieve relevant documents for a given query using vector similarity search."""
+        # Repeated queries skip both the embedding calculation and the database round trip
+        cache_key = (query, max_results)
+        documents = self._retrieval_cache.get(cache_key)
+        if documents is not None:
+            self._retrieval_cache.move_to_end(cache_key)
+            return list(documents)
+
         try:
             # Calculate embeddings for the query
-            query_embeddings = self.embedding_calculator.calculate_embeddings(query)
+            query_embeddings = await self._embed(query)
 
             # Search for similar documents in the vector database
-            return self.vector_db.search(query_embeddings, max_results)
-            
+            documents = await asyncio.to_thread(self.vector_db.search, query_embeddings, max_results)
+
         except Exception as e:
-            print(f"❌ Error in RAG document retrieval: {e}")
+            self.logger.error("Error in RAG document retrieval: %s", e)
             # Return empty list on error to allow conversation to continue
             return []
-    
+
+        self._retrieval_cache[cache_key] = documents
+        if len(self._retrieval_cache) > self.RETRIEVAL_CACHE_SIZE:
+            self._retrieval_cache.popitem(last=False)
+        return list(documents)
+
+    async def find_cached_response(self, query: str) -> Optional[str]:
+        """Find a cached response to a semantically similar query."""
+        try:
+            query_embeddings = await self._embed(query)
+            return await asyncio.to_thread(
+                self.vector_db.search_cached_response,
+                query_embeddings, self.SEMANTIC_CACHE_MIN_SIMILARITY, self.SEMANTIC_CACHE_MAX_AGE_SECONDS
+            )
+
+        except Exception as e:
+            self.logger.error("Error in semantic cache lookup: %s", e)
+            # Treat errors as a cache miss to allow conversation to continue
+            return None
+
+    async def cache_response(self, query: str, response: str) -> None:
+        """Cache the response to a query for semantically similar queries."""
+        try:
+            query_embeddings = await self._embed(query)
+            await asyncio.to_thread(
+                self.vector_db.insert_cached_response,
+                query_embeddings, response, self.SEMANTIC_CACHE_MAX_AGE_SECONDS
+            )
+
+        except Exception as e:
+            self.logger.error("Error in semantic cache update: %s", e)
+
     async def calculate_embeddings(self, text: str) -> np.ndarray:
         """Calculate embeddings for a given text."""
         try:
-            embeddings = self.embedding_calculator.calculate_embeddings(text)
+            embeddings = await self._embed(text)
             return embeddings
-            
+
         except Exception as e:
-            print(f"❌ Error in embedding calculation: {e}")
-            raise RuntimeError(f"Embedding calculation failed: {str(e)}")
\ No newline at end of file
+            self.logger.error("Error in embedding calculation: %s", e)
+            raise RuntimeError(f"Embedding calculation failed: {str(e)}")
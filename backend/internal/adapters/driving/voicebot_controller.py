@@ -1,7 +1,16 @@
+import array
+import asyncio
+import logging
+import math
+import struct
 import time
+import traceback
+from typing import Optional
 from fastapi import WebSocket, WebSocketDisconnect
-import json
+from fastapi.websockets import WebSocketState
 import numpy as np
+import orjson
+from backend.internal.application.conversation_service import ConversationService
 from backend.internal.application.voicebot_service import VoicebotService
 from backend.internal.application.voice_activity_detector_service import VoiceActivityDetector
 from backend.internal.domain.models.audio_transcription import AudioTranscription
@@ -17,9 +26,18 @@ class VoicebotController:
     VAD_MIN_SPEECH_DURATION_MS: int = 100
     VAD_SAMPLE_RATE: int = 48000
     MIN_TRANSCRIPTION_LENGTH: int = 1
+    # Samples per PCM chunk sent by the frontend's audio processor
+    PCM_CHUNK_SAMPLES: int = 2048
+    # Seconds of received audio buffered per connection before the oldest chunks are dropped
+    AUDIO_QUEUE_SECONDS: float = 3.0
+    AUDIO_QUEUE_SIZE: int = math.ceil(AUDIO_QUEUE_SECONDS * VAD_SAMPLE_RATE / PCM_CHUNK_SAMPLES)
+    # Utterances of a connection transcribed concurrently, their responses are streamed in order.
+    # Further utterances are dropped as a whole, VAD never waits for a free slot
+    MAX_PENDING_UTTERANCES: int = 2
 
     def __init__(self, voicebot_service: VoicebotService):
         self.voicebot_service = voicebot_service
+        self.logger = logging.getLogger(__name__)
 
     def _create_vad_detector(self) -> VoiceActivityDetector:
         """Create VAD detector with optimized parameters."""
@@ -41,11 +59,10 @@ class VoicebotController:
         }
 
     @staticmethod
-    def _create_audio_message(audio_chunk, chunk_number: int, response_id: int, llm_response: str = None) -> dict:
-        """Create audio message template."""
+    def _create_audio_message(chunk_number: int, response_id: int, llm_response: str = None) -> dict:
+        """Create audio message header template, the samples follow in the binary frame."""
         msg = {
             "type": "audio",
-            "data": list(audio_chunk),
             "chunk_number": chunk_number,
             "status": "streaming",
             "id": response_id,
@@ -72,23 +89,47 @@ class VoicebotController:
             "status": "complete"
         }
 
+    @staticmethod
+    def _create_audio_frame(header: dict, audio_chunk: bytes) -> bytes:
+        """Frame audio as header length (uint32 LE), JSON header and raw LINEAR16 samples.
+
+        The header is padded to an even length so clients can view the samples as int16 in place.
+        """
+        header_bytes = orjson.dumps(header)
+        if len(header_bytes) % 2:
+            header_bytes += b' '
+        return b''.join((struct.pack('<I', len(header_bytes)), header_bytes, audio_chunk))
+
+    @staticmethod
+    async def _send_audio_message(websocket: WebSocket, header: dict, audio_chunk: bytes):
+        """Send audio as a binary frame via WebSocket with error handling."""
+        if websocket.client_state != WebSocketState.CONNECTED:
+            return
+        try:
+            await websocket.send_bytes(VoicebotController._create_audio_frame(header, audio_chunk))
+        except Exception:
+            pass  # Connection might be closed
+
     @staticmethod
     async def _send_json_message(websocket: WebSocket, message: dict):
         """Send JSON message via WebSocket with error handling."""
+        if websocket.client_state != WebSocketState.CONNECTED:
+            return
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception:
             pass  # Connection might be closed
 
     async def _process_transcription_and_generate_audio(self, websocket: WebSocket, transcription: AudioTranscription,
-                                                        start_time: float, voice: str = None):
+                                                        start_time: float, voice: str = None,
+                                                        conversation: Optional[ConversationService] = None):
         """Process transcription through LLM and stream audio response."""
         try:
             print(f"🤖 Processing transcription through LLM: {transcription.text}")
 
             selected_voice = voice if voice else self.DEFAULT_VOICE
             audio_stream = self.voicebot_service.generate_streaming_voice_response(
-                transcription.text, voice=selected_voice
+                transcription.text, voice=selected_voice, conversation=conversation
             )
 
             await self._stream_audio_response(websocket, audio_stream)
@@ -98,7 +139,6 @@ class VoicebotController:
 
         except Exception as llm_error:
             print(f"❌ Error in LLM processing or audio generation: {llm_error}")
-            import traceback
             traceback.print_exc()
 
             error_message = self._create_error_message(
@@ -109,24 +149,30 @@ class VoicebotController:
     async def _stream_audio_response(self, websocket: WebSocket, audio_stream, response_id: int = None):
         """Stream audio chunks back via WebSocket."""
         chunk_count = 0
-        previous_text = None
         if response_id is None:
             response_id = int(time.time())
 
         async for audio_chunk, text in audio_stream:
             if audio_chunk:
                 chunk_count += 1
-                llm_response = text if text != previous_text else None
-                audio_message = self._create_audio_message(audio_chunk, chunk_count, response_id, llm_response)
-                previous_text = text
-                await self._send_json_message(websocket, audio_message)
+                # The response text as submitted to synthesis, each part is forwarded once
+                audio_message = self._create_audio_message(chunk_count, response_id, text)
+                await self._send_audio_message(websocket, audio_message, audio_chunk)
 
         end_message = self._create_end_message(chunk_count)
         await self._send_json_message(websocket, end_message)
         print(f"🔊 Audio streaming complete - sent {chunk_count} chunks")
 
-    async def _handle_transcription(self, websocket: WebSocket, audio_data: np.ndarray, start_time: float, voice: str = None):
-        """Handle transcription of audio data."""
+    async def _handle_transcription(self, websocket: WebSocket, audio_data: np.ndarray, start_time: float, voice: str = None,
+                                    previous_utterance: Optional[asyncio.Task] = None,
+                                    conversation: Optional[ConversationService] = None):
+        """Handle transcription of audio data, responding after the previous utterance has been answered.
+
+        Only the transcription overlaps with the previous response. Everything sent, errors included,
+        waits for it, so each utterance finishes after its predecessor and responses never interleave.
+        """
+        transcription = None
+        error_result = None
         try:
             start = time.time()
             transcription = await self.voicebot_service.transcribe_audio(
@@ -135,21 +181,39 @@ class VoicebotController:
 
             print(f"🎤 Transcription time: {time.time() - start:.3f}s")
 
-            if transcription.text and len(transcription.text.strip()) > self.MIN_TRANSCRIPTION_LENGTH:
+        except Exception as e:
+            print(f"❌ Transcription error: {e}")
+            error_result = self._create_error_message("error", f"Transcription failed: {str(e)}")
+
+        if previous_utterance is not None:
+            # Respond in the order the utterances were spoken
+            await asyncio.wait([previous_utterance])
+
+        try:
+            if error_result is not None:
+                await self._send_json_message(websocket, error_result)
+
+            elif transcription.text and len(transcription.text.strip()) > self.MIN_TRANSCRIPTION_LENGTH:
                 transcription_result = self._create_transcription_message(transcription)
                 print(f"🎤 VAD-based transcription: {transcription.text}")
                 await self._send_json_message(websocket, transcription_result)
-                await self._process_transcription_and_generate_audio(websocket, transcription, start_time, voice)
+                await self._process_transcription_and_generate_audio(websocket, transcription, start_time, voice,
+                                                                     conversation)
 
-        except Exception as e:
-            print(f"❌ Transcription error: {e}")
-            error_result = self._create_error_message("error", f"Transcription failed: {str(e)}")
-            await self._send_json_message(websocket, error_result)
+        except WebSocketDisconnect:
+            print("🔌 WebSocket disconnected before the response was sent")
 
-    async def _process_final_audio(self, websocket: WebSocket, vad: VoiceActivityDetector, voice: str = None):
+    @staticmethod
+    def _log_utterance_error(task: asyncio.Task):
+        """Retrieve and log an unexpected error of a background utterance task."""
+        if not task.cancelled() and task.exception() is not None:
+            print(f"❌ Error handling utterance: {task.exception()}")
+
+    async def _process_final_audio(self, websocket: WebSocket, vad: VoiceActivityDetector, voice: str = None,
+                                   conversation: Optional[ConversationService] = None):
         """Process any remaining buffered audio when connection closes."""
-        final_audio = vad.force_process_buffer()
-        if not final_audio:
+        final_audio = await asyncio.to_thread(vad.force_process_buffer)
+        if final_audio is None or len(final_audio) == 0:
             return
 
         print("🎤 Processing final buffered audio")
@@ -166,7 +230,7 @@ class VoicebotController:
                     print(f"🤖 Processing final transcription through LLM: {final_transcription.text}")
                     selected_voice = voice if voice else self.DEFAULT_VOICE
                     audio_stream = self.voicebot_service.generate_streaming_voice_response(
-                        final_transcription.text, voice=selected_voice
+                        final_transcription.text, voice=selected_voice, conversation=conversation
                     )
                     await self._stream_audio_response(websocket, audio_stream)
 
@@ -187,67 +251,142 @@ class VoicebotController:
 
         vad = self._create_vad_detector()
         selected_voice = self.DEFAULT_VOICE  # Store selected voice for this connection
-
+        # Answers of this connection, follow-up questions refer to them
+        conversation = self.voicebot_service.start_conversation()
+        # Received PCM chunks waiting for VAD processing, None marks the end of the stream
+        audio_queue: asyncio.Queue = asyncio.Queue(maxsize=self.AUDIO_QUEUE_SIZE)
+
+        # Received samples dropped on this connection, and whether the queue is currently overflowing
+        dropped_samples = 0
+        overflowing = False
+
+        def enqueue_audio(pcm_data):
+            """Queue a chunk, dropping the oldest one when processing falls behind."""
+            nonlocal dropped_samples, overflowing
+            if not audio_queue.full():
+                overflowing = False
+            elif (dropped := audio_queue.get_nowait()) is not None:
+                # Dropped audio is missing from the utterance it belonged to, each backlog is reported once
+                if not overflowing:
+                    self.logger.warning("Audio processing fell %.1fs behind, dropping the oldest audio",
+                                        self.AUDIO_QUEUE_SECONDS)
+                overflowing = True
+                dropped_samples += len(dropped)
+            audio_queue.put_nowait(pcm_data)
+
+        async def receive_audio():
+            """Receive messages while earlier chunks are processed, so latency stays bounded."""
+            nonlocal selected_voice
+            try:
+                while True:
+                    try:
+                        message = await websocket.receive()
+                        if message['type'] == 'websocket.disconnect':
+                            raise WebSocketDisconnect(message.get('code', 1000))
+
+                        if message.get('bytes') is not None:
+                            # Binary frames carry raw little-endian float32 PCM samples
+                            enqueue_audio(np.frombuffer(message['bytes'], dtype='<f4'))
+                            continue
+
+                        data = orjson.loads(message['text'])
+
+                        if data['type'] == 'voice_selection':
+                            # Handle voice selection message
+                            selected_voice = data.get('data', {}).get('voice', self.DEFAULT_VOICE)
+                            print(f"🎵 Voice selection received: {selected_voice}")
+
+                        elif data['type'] == 'pcm':
+                            # array converts the float list in a single C pass, wrapped without a copy
+                            enqueue_audio(np.frombuffer(array.array('f', data['data']), dtype=np.float32))
+
+                    except WebSocketDisconnect:
+                        print("🔌 WebSocket disconnected during audio streaming")
+                        break
+                    except orjson.JSONDecodeError as e:
+                        print(f"❌ Invalid JSON received: {e}")
+                        continue
+                    except Exception as e:
+                        print(f"❌ Error receiving audio chunk: {e}")
+                        continue
+            finally:
+                enqueue_audio(None)
+
+        # Utterances are handled in the background so VAD keeps up with the incoming audio
+        utterance_tasks: set[asyncio.Task] = set()
+        previous_utterance: Optional[asyncio.Task] = None
+
+        receive_task = asyncio.create_task(receive_audio())
         try:
-            while True:
+            while (pcm_data := await audio_queue.get()) is not None:
                 try:
-                    message = await websocket.receive_text()
-                    data = json.loads(message)
+                    start_time = time.time()
+
+                    # VAD classification runs off the event loop, chunks of a connection are processed one at a time
+                    should_transcribe, accumulated_audio = await asyncio.to_thread(vad.process_audio_chunk, pcm_data)
+
+                    if should_transcribe and accumulated_audio is not None and len(accumulated_audio) > 0:
+                        if len(utterance_tasks) >= self.MAX_PENDING_UTTERANCES:
+                            # Stalling here would make the receiver drop raw audio of the next utterance instead
+                            self.logger.warning("Dropping utterance, %d utterances still pending", len(utterance_tasks))
+                            busy_message = self._create_error_message(
+                                "transcription_error", "Still answering previous questions, please repeat your question"
+                            )
+                            await self._send_json_message(websocket, busy_message)
+                            continue
+
+                        previous_utterance = asyncio.create_task(self._handle_transcription(
+                            websocket, accumulated_audio, start_time, selected_voice, previous_utterance, conversation
+                        ))
+                        utterance_tasks.add(previous_utterance)
+                        previous_utterance.add_done_callback(utterance_tasks.discard)
+                        previous_utterance.add_done_callback(self._log_utterance_error)
 
-                    if data['type'] == 'voice_selection':
-                        # Handle voice selection message
-                        selected_voice = data.get('data', {}).get('voice', self.DEFAULT_VOICE)
-                        print(f"🎵 Voice selection received: {selected_voice}")
-                        
-                    elif data['type'] == 'pcm':
-                        pcm_data = np.array(data['data'], dtype=np.float32)
-                        start_time = time.time()
-
-                        should_transcribe, accumulated_audio = vad.process_audio_chunk(pcm_data)
-
-                        if should_transcribe and accumulated_audio is not None and len(accumulated_audio) > 0:
-                            await self._handle_transcription(websocket, accumulated_audio, start_time, selected_voice)
-
-                except WebSocketDisconnect:
-                    print("🔌 WebSocket disconnected during audio streaming")
-                    break
-                except json.JSONDecodeError as e:
-                    print(f"❌ Invalid JSON received: {e}")
-                    continue
                 except Exception as e:
                     print(f"❌ Error processing audio chunk: {e}")
                     continue
 
-            await self._process_final_audio(websocket, vad, selected_voice)
+            # Answer the pending utterances before the remaining buffered audio
+            if previous_utterance is not None:
+                await asyncio.wait([previous_utterance])
+            await self._process_final_audio(websocket, vad, selected_voice, conversation)
 
         except WebSocketDisconnect:
             print("🔌 WebSocket disconnected")
         except Exception as e:
             print(f"❌ Error in WebSocket audio transcription: {e}")
-            import traceback
             traceback.print_exc()
 
             error_result = self._create_error_message("error", str(e))
             await self._send_json_message(websocket, error_result)
+        finally:
+            receive_task.cancel()
+            for task in utterance_tasks:
+                task.cancel()
+            if dropped_samples:
+                self.logger.warning("Dropped %.1fs of received audio while processing fell behind",
+                                    dropped_samples / self.VAD_SAMPLE_RATE)
 
     async def text_input_websocket(self, websocket: WebSocket):
         """Handle WebSocket connection for text input with audio response streaming."""
         await websocket.accept()
         print("🔌 WebSocket connection established for text input with audio response")
+        # Answers of this connection, follow-up questions refer to them
+        conversation = self.voicebot_service.start_conversation()
 
         try:
             while True:
                 try:
                     message = await websocket.receive_text()
-                    data = json.loads(message)
+                    data = orjson.loads(message)
 
                     if data['type'] == 'text_prompt':
-                        await self._handle_text_input(websocket, data['data'])
+                        await self._handle_text_input(websocket, data['data'], conversation)
 
                 except WebSocketDisconnect:
                     print("🔌 WebSocket disconnected during text processing")
                     break
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     print(f"❌ Invalid JSON received: {e}")
                     continue
                 except Exception as e:
@@ -258,13 +397,13 @@ class VoicebotController:
             print("🔌 WebSocket disconnected")
         except Exception as e:
             print(f"❌ Error in WebSocket text input processing: {e}")
-            import traceback
             traceback.print_exc()
 
             error_result = self._create_error_message("error", str(e))
             await self._send_json_message(websocket, error_result)
 
-    async def _handle_text_input(self, websocket: WebSocket, data: dict):
+    async def _handle_text_input(self, websocket: WebSocket, data: dict,
+                                 conversation: Optional[ConversationService] = None):
         """Handle text input and generate audio response."""
         text_input = data.get('text', '').strip()
         voice = data.get('voice', self.DEFAULT_VOICE)
@@ -278,10 +417,11 @@ class VoicebotController:
         start_time = time.time()
 
         try:
-            audio_stream = self.voicebot_service.generate_streaming_voice_response(text_input, voice=voice)
+            audio_stream = self.voicebot_service.generate_streaming_voice_response(
+                text_input, voice=voice, conversation=conversation
+            )
 
             chunk_count = 0
-            previous_text = None
             response_id = int(time.time())
 
             async for audio_chunk, text in audio_stream:
@@ -289,15 +429,13 @@ class VoicebotController:
                     chunk_count += 1
                     audio_message = {
                         "type": "audio_chunk",
-                        "chunk": list(audio_chunk),
                         "chunk_number": chunk_count,
                         "status": "streaming",
                         "id": response_id,
                     }
-                    if text != previous_text:
+                    if text:
                         audio_message["llm_response"] = text
-                    previous_text = text
-                    await self._send_json_message(websocket, audio_message)
+                    await self._send_audio_message(websocket, audio_message, audio_chunk)
 
             end_message = self._create_end_message(chunk_count)
             await self._send_json_message(websocket, end_message)
@@ -308,7 +446,6 @@ class VoicebotController:
 
         except Exception as llm_error:
             print(f"❌ Error in LLM processing or audio generation: {llm_error}")
-            import traceback
             traceback.print_exc()
 
             error_message = self._create_error_message(
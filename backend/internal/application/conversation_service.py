@@ -1,11 +1,23 @@
+import string
 from typing import List
 
 from backend.internal.domain.models.audio_transcription import AudioTranscription
 from backend.internal.domain.models.conversation_context import ConversationContext
 
 
+# Opening words of questions that refer back to the previous answers ("Und warum?", "Erzähl mehr davon")
+_FOLLOW_UP_WORDS = frozenset({
+    "und", "aber", "oder", "also", "dann", "warum", "wieso", "weshalb", "ja", "nein", "ok", "okay",
+    "noch", "mehr", "erzähl", "erzähle", "das", "dies", "diese", "dieser", "dieses", "es", "er", "sie",
+    "dazu", "davon", "darüber", "damit", "dafür", "dabei",
+})
+
+
 class ConversationService:
-    """Domain service containing core business logic for conversation processing."""
+    """Domain service containing core business logic for the conversation of one session."""
+
+    # Questions shorter than this rarely stand on their own within a conversation
+    MIN_STANDALONE_QUESTION_LENGTH: int = 20
 
     def __init__(self):
         self.history = []
@@ -25,13 +37,27 @@ class ConversationService:
         """Add conversation context to history."""
         self.history.append(text)
 
+    def is_follow_up(self, query: str) -> bool:
+        """Check whether a question may refer to the previous answers of the conversation."""
+        if not self.history:
+            return False
+
+        query = query.strip()
+        words = query.lower().split(maxsplit=1)
+        first_word = words[0].strip(string.punctuation) if words else ""
+        return len(query) < self.MIN_STANDALONE_QUESTION_LENGTH or first_word in _FOLLOW_UP_WORDS
+
+    def get_recent_history(self) -> List[str]:
+        """Get the most recent answers, the part of the history passed to the LLM."""
+        return self.history[-10:]
+
     def create_conversation_context(self, transcription: AudioTranscription,
                                     relevant_documents: List[str]) -> ConversationContext:
         """Create conversation context from transcription and retrieved documents."""
         return ConversationContext(
             user_query=transcription.get_clean_text(),
             relevant_documents=relevant_documents,
-            conversation_history=self.history[-10:]
+            conversation_history=self.get_recent_history()
         )
 
     @staticmethod
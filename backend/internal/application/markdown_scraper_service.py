@@ -30,11 +30,10 @@ class MarkdownScraperService:
             # Parse the markdown file
             document = self.markdown_parser.parse_file(file_path)
 
-            # Store each non-empty text section in the vector database
-            stored_count = 0
-            for section in document.get_non_empty_sections():
-                self.vector_database.insert_document(section.get_clean_content())
-                stored_count += 1
+            # Store all non-empty text sections in the vector database in one batch
+            contents = [section.get_clean_content() for section in document.get_non_empty_sections()]
+            self.vector_database.insert_documents(contents)
+            stored_count = len(contents)
 
             print(f"Successfully scraped and stored {stored_count} text sections from {file_path}")
             print(f"Total word count: {document.get_total_word_count()}")
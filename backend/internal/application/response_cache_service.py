@@ -0,0 +1,37 @@
+import hashlib
+import re
+from collections import OrderedDict
+from typing import List, Optional
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class ResponseCacheService:
+    """Application service caching LLM responses for exactly repeated questions."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, List[str]] = OrderedDict()
+
+    @staticmethod
+    def create_key(user_query: str) -> str:
+        """Create a cache key from the normalized (case and whitespace insensitive) question.
+
+        Only standalone questions are cached, the answers of follow-ups depend on their conversation.
+        """
+        normalized_query = _WHITESPACE_PATTERN.sub(" ", user_query.strip().lower())
+        return hashlib.sha256(normalized_query.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Get the cached response chunks for a key, if present."""
+        chunks = self._entries.get(key)
+        if chunks is not None:
+            self._entries.move_to_end(key)
+        return chunks
+
+    def put(self, key: str, chunks: List[str]) -> None:
+        """Store response chunks, evicting the least recently used entry when full."""
+        self._entries[key] = chunks
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -97,8 +97,9 @@ class VoiceActivityDetector:
 
         try:
             # Create AudioData object for MediaPipe
+            # AudioData copies the samples, float32 input (read-only frame views included) is passed as is
             audio_data = AudioData.create_from_array(
-                src=pcm_data.astype(np.float32),
+                src=np.asarray(pcm_data, dtype=np.float32),
                 sample_rate=self.sample_rate
             )
 
@@ -171,6 +172,9 @@ class VoiceActivityDetector:
         # Analyze voice activity using PCM data
         has_voice = self.analyze_pcm_audio_activity(pcm_data)
         self.pcm_buffer.append(pcm_data)
+        # Before speech only the pre-speech audio is kept, so silence does not grow the buffer
+        if not self.is_speaking and len(self.pcm_buffer) > self.pre_speech_chunk_count:
+            del self.pcm_buffer[0]
 
         # Update voice activity state with smoothing
         if has_voice:
@@ -183,7 +187,6 @@ class VoiceActivityDetector:
                     self.is_speaking = True
                     self.first_voice_time = current_time
                     self.speech_start_time = current_time
-                    self.pcm_buffer = self.pcm_buffer[-self.pre_speech_chunk_count:]
                     self.logger.info("🎤 Voice activity started")
 
             return False, None  # Continue accumulating
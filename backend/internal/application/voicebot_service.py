@@ -1,30 +1,67 @@
-import time
-from typing import AsyncGenerator, Any
+import asyncio
+import re
+from typing import AsyncGenerator, Any, List, Optional
 
 import numpy as np
 
 from backend.internal.application.conversation_service import ConversationService
+from backend.internal.application.response_cache_service import ResponseCacheService
 from backend.internal.domain.models.audio_transcription import AudioTranscription
 from backend.internal.ports.output.llm_port import LLMPort
 from backend.internal.ports.output.rag_port import RAGPort
 from backend.internal.ports.output.speech_recognition_port import SpeechRecognitionPort
 from backend.internal.ports.output.tts_port import TTSPort
 
+_SENTENCE_END_PUNCTUATION = frozenset('.!?')
+_BREAK_PATTERN = re.compile(r'[.!?,;:]')
+
+# Sentences of a complete text, including the whitespace following them
+_SENTENCE_PATTERN = re.compile(r'.+?(?:[.!?](?=\s|$)\s*|$)', re.DOTALL)
+
 
 class VoicebotService:
     """Application service orchestrating the complete voicebot conversation flow."""
 
+    # Static task description, passed to the LLM once as system instruction
+    SYSTEM_INSTRUCTION: str = (
+        "Du bist ein KI Agent, welcher ausführliche Antworten auf Fragen von Nutzern geben kann."
+        "Unter 'Frage' ist die Frage des nutzers gegeben."
+        "Unter 'Kontext' ist weiterer Kontext bereitgestellt, welcher bei der Beantwortung der Frage hilfreich sein kann."
+        "Nutze den Kontext, wenn möglich um die Frage zu beantworten."
+        "Ist der Kontext nicht hilfreich, ignoriere ihn."
+        "Möglicherweise sind auch die letzten Antworten der Konversation unter 'Letzten Antworten' gegeben."
+        "Nutze die letzten Antworten nur, um Fragen zu beantworten, welche im Zusammenhang damit stehen."
+        "Nutze die letzten Antworten nicht erneut als Antwort."
+        "Sind die letzte Antworten nicht hilfreich, ignoriere sie."
+        "Gebe nur ganze Sätze wieder, welche mit Hilfe von TTS an den Benutzer ausgegeben werden."
+    )
+
+    # Maximum number of LLM sentences buffered ahead of the TTS stage
+    LLM_BUFFER_SIZE: int = 4
+    # Minimum length of a clause sent to TTS without a sentence end
+    MIN_CLAUSE_LENGTH: int = 30
+    # Minimum length of a question answered from or added to the shared semantic cache,
+    # shorter ones ("ja", "und dann?") embed too vaguely to match reliably
+    SEMANTIC_CACHE_MIN_QUERY_LENGTH: int = 20
+
+    # Fixed prompt section headers, concatenated around the dynamic parts
+    _HISTORY_HEAD: str = "Letzten Antworten:\n"
+    _CONTEXT_HEAD: str = "Kontext:\n"
+    _QUESTION_HEAD: str = "\n\nFrage: "
+
     def __init__(self,
                  speech_recognition: SpeechRecognitionPort,
                  rag: RAGPort,
                  llm: LLMPort,
                  tts: TTSPort,
-                 conversation_service: ConversationService):
+                 conversation_service: ConversationService,
+                 response_cache: Optional[ResponseCacheService] = None):
         self.speech_recognition = speech_recognition
         self.rag = rag
         self.llm = llm
         self.tts = tts
         self.conversation_service = conversation_service
+        self.response_cache = response_cache or ResponseCacheService()
 
     async def transcribe_audio(self, audio_data: np.ndarray, language_code: str = "de-DE") -> AudioTranscription:
         """Transcribe audio data to text using the speech recognition port."""
@@ -35,54 +72,175 @@ class VoicebotService:
 
         return transcription
 
-    async def generate_streaming_voice_response(self, prompt: str, voice: str = None) -> AsyncGenerator[
-        tuple[Any, Any], None]:
-        """Generate a streaming voice response from a text prompt."""
-        voice_settings = self.conversation_service.prepare_response_settings(voice)
-        relevant_documents = await self.rag.retrieve_relevant_documents(prompt)
-        context = self.conversation_service.create_conversation_context(
-            AudioTranscription(text=prompt),
-            relevant_documents
-        )
-
-        final_prompt = self._build_prompt_with_context(context)
-        text_stream = self.llm.generate_response_stream(final_prompt)
+    @staticmethod
+    def start_conversation() -> ConversationService:
+        """Start the conversation state of a new session, e.g. a WebSocket connection."""
+        return ConversationService()
 
-        responses = set()
+    async def generate_streaming_voice_response(self, prompt: str, voice: str = None,
+                                                conversation: Optional[ConversationService] = None) -> AsyncGenerator[
+        tuple[Any, Any], None]:
+        """Generate a streaming voice response from a text prompt.
+
+        The answer is added to the conversation of the session, without a conversation the
+        prompt is answered as a standalone question.
+        """
+        conversation = conversation or self.start_conversation()
+        voice_settings = conversation.prepare_response_settings(voice)
+        response_chunks: List[str] = []
+        generated = False
+
+        # Cached responses are shared across sessions, follow-up questions are never answered from them
+        standalone = not conversation.is_follow_up(prompt)
+
+        # The semantic cache is also persistent and matches by similarity, which is unreliable for
+        # very short questions even at the start of a session
+        use_semantic_cache = standalone and len(prompt.strip()) >= self.SEMANTIC_CACHE_MIN_QUERY_LENGTH
+
+        # Exactly repeated questions are answered from memory, before the query is even embedded
+        cache_key = self.response_cache.create_key(prompt) if standalone else None
+        cached_chunks = self.response_cache.get(cache_key) if cache_key is not None else None
+        if cached_chunks is not None:
+            text_stream = self._replay_stream(cached_chunks)
+        else:
+            retrieval = None
+            cached_response = None
+            if use_semantic_cache:
+                # Speculatively retrieve the documents while the semantic cache is checked,
+                # both share the query embedding
+                retrieval = asyncio.ensure_future(self.rag.retrieve_relevant_documents(prompt))
+                try:
+                    # Semantically similar questions are answered from the cache, skipping retrieval and the LLM
+                    cached_response = await self.rag.find_cached_response(prompt)
+                except BaseException:
+                    # Do not leave the speculative retrieval running when the turn is aborted
+                    retrieval.cancel()
+                    raise
+
+            if cached_response is not None:
+                retrieval.cancel()
+                cached_chunks = _SENTENCE_PATTERN.findall(cached_response)
+                self.response_cache.put(cache_key, cached_chunks)
+                text_stream = self._replay_stream(cached_chunks)
+            else:
+                if retrieval is not None:
+                    relevant_documents = await retrieval
+                else:
+                    relevant_documents = await self.rag.retrieve_relevant_documents(prompt)
+                context = conversation.create_conversation_context(
+                    AudioTranscription(text=prompt),
+                    relevant_documents
+                )
+
+                final_prompt = self._build_prompt_with_context(context)
+                text_stream = self._buffer_stream(
+                    self._batch_sentences(self.llm.generate_response_stream(final_prompt)),
+                    self.LLM_BUFFER_SIZE
+                )
+                generated = True
 
         # Convert text stream to audio stream
+        text_stream = self._record_stream(text_stream, response_chunks)
         async for audio_chunk, text in self.tts.synthesize_speech_stream(text_stream, voice_settings):
-            responses.add(text)
             yield audio_chunk, text
 
-        response_text = " ".join(responses)
+        # Only cache responses that were generated and streamed completely
+        if generated and response_chunks:
+            if cache_key is not None:
+                self.response_cache.put(cache_key, response_chunks)
+            if use_semantic_cache:
+                await self.rag.cache_response(prompt, "".join(response_chunks))
+
+        # Only reached once the response was streamed completely, empty answers carry no context
+        answer = "".join(response_chunks).strip()
+        if answer:
+            conversation.add_to_history(answer)
 
-        self.conversation_service.add_to_history(response_text)
+    @staticmethod
+    async def _buffer_stream(stream: AsyncGenerator[Any, None], maxsize: int) -> AsyncGenerator[Any, None]:
+        """Drain a stream in a background task through a bounded queue.
+
+        The producer keeps running while the consumer is busy (e.g. the LLM keeps generating
+        while TTS synthesizes the previous sentence), the bound provides backpressure.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        end_of_stream = object()
+
+        async def producer():
+            try:
+                async for item in stream:
+                    await queue.put(item)
+                await queue.put(end_of_stream)
+            except Exception as e:
+                await queue.put(e)
+
+        producer_task = asyncio.create_task(producer())
+        try:
+            while True:
+                item = await queue.get()
+                if item is end_of_stream:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer_task.cancel()
+
+    @staticmethod
+    async def _batch_sentences(stream: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+        """Merge small LLM token chunks into sentence sized chunks for the TTS stage.
+
+        Chunks end at the last sentence end, otherwise at the last natural break after at least
+        MIN_CLAUSE_LENGTH characters. Only newly appended text is scanned for break points.
+        """
+        buffer = ""
+        # End offsets of the last sentence end and natural break in the buffer (0 if none)
+        sentence_end = natural_break = 0
+        async for chunk in stream:
+            scan_position = len(buffer)
+            buffer += chunk
+            for match in _BREAK_PATTERN.finditer(buffer, scan_position):
+                if match.group() in _SENTENCE_END_PUNCTUATION:
+                    sentence_end = match.end()
+                else:
+                    natural_break = match.end()
+
+            split_position = sentence_end or (natural_break if natural_break > VoicebotService.MIN_CLAUSE_LENGTH else 0)
+            if split_position:
+                yield buffer[:split_position]
+                buffer = buffer[split_position:]
+                # The remainder follows the last sentence end, only natural breaks can be left in it
+                sentence_end = 0
+                natural_break = natural_break - split_position if natural_break > split_position else 0
+
+        if buffer.strip():
+            yield buffer
+
+    @staticmethod
+    async def _replay_stream(chunks: List[str]) -> AsyncGenerator[str, None]:
+        """Replay cached response chunks, keeping their boundaries for sentence-wise synthesis."""
+        for chunk in chunks:
+            yield chunk
+
+    @staticmethod
+    async def _record_stream(stream: AsyncGenerator[str, None], chunks: List[str]) -> AsyncGenerator[str, None]:
+        """Pass a response stream through while recording its chunks, joined once at the end of the turn."""
+        async for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
 
     @staticmethod
     def _build_prompt_with_context(context) -> str:
-        """Build the final prompt including context if appropriate."""
-        base_prompt = (
-            "Du bist ein KI Agent, welcher ausführliche Antworten auf Fragen von Nutzern geben kann."
-            "Unter 'Frage' ist die Frage des nutzers gegeben."
-            "Unter 'Kontext' ist weiterer Kontext bereitgestellt, welcher bei der Beantwortung der Frage hilfreich sein kann."
-            "Nutze den Kontext, wenn möglich um die Frage zu beantworten."
-            "Ist der Kontext nicht hilfreich, ignoriere ihn."
-            "Möglicherweise sind auch die letzten Antworten der Konversation unter 'Letzten Antworten' gegeben."
-            "Nutze die letzten Antworten nur, um Fragen zu beantworten, welche im Zusammenhang damit stehen."
-            "Nutze die letzten Antworten nicht erneut als Antwort."
-            "Sind die letzte Antworten nicht hilfreich, ignoriere sie."
-            "Gebe nur ganze Sätze wieder, welche mit Hilfe von TTS an den Benutzer ausgegeben werden."
-        )
+        """Build the final prompt including context if appropriate.
 
+        Parts are ordered from most to least stable across turns (history only grows,
+        context and question change every time), so consecutive prompts share the
+        longest possible byte-identical prefix for Gemini's implicit prompt caching.
+        """
         last_answers, count = context.get_conversation_history()
+        context_part = VoicebotService._CONTEXT_HEAD + context.get_context_summary() + VoicebotService._QUESTION_HEAD
 
         if count == 0:
-            return (f"{base_prompt}\n\n"
-                    f"Kontext:\n{context.get_context_summary()}\n\n"
-                    f"Frage: {context.user_query}")
-
-        return (f"{base_prompt}\n\n"
-                f"Kontext:\n{context.get_context_summary()}\n\n"
-                f"Letzten {count} Antworten:\n{last_answers}\n\n"
-                f"Frage: {context.user_query}")
+            return context_part + context.user_query
+
+        return VoicebotService._HISTORY_HEAD + last_answers + "\n\n" + context_part + context.user_query
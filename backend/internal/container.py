@@ -1,9 +1,11 @@
 """Dependency injection container for ports and adapters architecture."""
 
 from backend.internal.adapters.driven.all_mpnet_base_v2 import AllMPNetBaseV2
+from backend.internal.adapters.driven.cached_embedding_calculator import CachedEmbeddingCalculator
 from backend.internal.adapters.driven.postgres_db import PostgresVectorDB
 from backend.internal.application.voicebot_service import VoicebotService
 from backend.internal.application.conversation_service import ConversationService
+from backend.internal.application.response_cache_service import ResponseCacheService
 from backend.internal.adapters.driven.gemini_llm_adapter import GeminiLLMAdapter
 from backend.internal.adapters.driven.google_speech_adapter import GoogleSpeechAdapter
 from backend.internal.adapters.driven.google_tts_adapter import GoogleTTSAdapter
@@ -23,6 +25,12 @@ class Container:
         if 'conversation_service' not in self._instances:
             self._instances['conversation_service'] = ConversationService()
         return self._instances['conversation_service']
+
+    def get_response_cache_service(self) -> ResponseCacheService:
+        """Get or create ResponseCacheService instance."""
+        if 'response_cache_service' not in self._instances:
+            self._instances['response_cache_service'] = ResponseCacheService()
+        return self._instances['response_cache_service']
     
     def get_speech_recognition_adapter(self) -> GoogleSpeechAdapter:
         """Get or create GoogleSpeechAdapter instance."""
@@ -33,13 +41,16 @@ class Container:
     def get_llm_adapter(self) -> GeminiLLMAdapter:
         """Get or create GeminiLLMAdapter instance."""
         if 'llm_adapter' not in self._instances:
-            self._instances['llm_adapter'] = GeminiLLMAdapter()
+            self._instances['llm_adapter'] = GeminiLLMAdapter(
+                system_instruction=VoicebotService.SYSTEM_INSTRUCTION
+            )
         return self._instances['llm_adapter']
     
     def get_rag_adapter(self) -> RAGAdapter:
         """Get or create RAGAdapter instance."""
         if 'rag_adapter' not in self._instances:
-            embedding_calculator = AllMPNetBaseV2()
+            model = AllMPNetBaseV2()
+            embedding_calculator = CachedEmbeddingCalculator(model, model.MODEL_NAME, model.precision)
             vector_db = PostgresVectorDB(embedding_calculator)
             
             self._instances['rag_adapter'] = RAGAdapter(
@@ -62,7 +73,8 @@ class Container:
                 rag=self.get_rag_adapter(),
                 llm=self.get_llm_adapter(),
                 tts=self.get_tts_adapter(),
-                conversation_service=self.get_conversation_service()
+                conversation_service=self.get_conversation_service(),
+                response_cache=self.get_response_cache_service()
             )
         return self._instances['voicebot_service']
     
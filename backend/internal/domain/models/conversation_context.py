@@ -18,12 +18,7 @@ class ConversationContext:
         if not self.has_relevant_context():
             return ""
 
-        summary = ""
-        for document in self.relevant_documents:
-            document = document.replace("\n", " ")
-            summary += f"\n - '{document}'"
-
-        return summary
+        return "".join("\n - '" + document.replace("\n", " ") + "'" for document in self.relevant_documents)
 
     def get_conversation_history(self) -> Tuple[str, int]:
         """Get the conversation history."""
@@ -1,9 +1,15 @@
-from abc import abstractmethod, ABC
+from typing import List, Protocol
 
 import numpy as np
 
 
-class EmbeddingCalculator(ABC):
-    @abstractmethod
+class EmbeddingCalculator(Protocol):
+    """Port (interface) for embedding calculation, satisfied structurally by any matching implementation."""
+
     def calculate_embeddings(self, text: str) -> np.ndarray:
         """Calculate embedding for given text."""
+        ...
+
+    def calculate_embeddings_batch(self, texts: List[str]) -> np.ndarray:
+        """Calculate embeddings for multiple texts in one call, one row per text."""
+        ...
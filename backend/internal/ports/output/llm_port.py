@@ -16,4 +16,4 @@ class LLMPort(ABC):
         Yields:
             Chunks of generated text
         """
-        pass
\ No newline at end of file
+        pass
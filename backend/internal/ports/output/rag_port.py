@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 
@@ -32,4 +32,28 @@ class RAGPort(ABC):
         Returns:
             Vector embeddings as list of floats
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_cached_response(self, query: str) -> Optional[str]:
+        """
+        Find a cached response to a semantically similar query.
+
+        Args:
+            query: Search query
+
+        Returns:
+            The cached response, or None if no similar query was answered before
+        """
+        pass
+
+    @abstractmethod
+    async def cache_response(self, query: str, response: str) -> None:
+        """
+        Cache the response to a query for semantically similar queries.
+
+        Args:
+            query: Answered query
+            response: Complete response text
+        """
+        pass
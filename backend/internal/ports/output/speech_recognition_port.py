@@ -14,7 +14,7 @@ class SpeechRecognitionPort(ABC):
         Transcribe audio data to text.
         
         Args:
-            audio_data: Raw PCM audio data as numpy array
+            audio_data: Raw PCM audio data as float32 numpy array in the range [-1, 1]
             language_code: Language code for transcription
             
         Returns:
@@ -7,7 +7,7 @@ class TTSPort(ABC):
     
     @abstractmethod
     async def synthesize_speech_stream(self, text_stream: AsyncGenerator[str, None], 
-                                     voice: str) -> AsyncGenerator[bytes, None]:
+                                     voice: str) -> AsyncGenerator[tuple[bytes, str], None]:
         """
         Synthesize speech from streaming text.
         
@@ -16,6 +16,6 @@ class TTSPort(ABC):
             voice: Voice settings/identifier
             
         Yields:
-            Audio data chunks as bytes
+            Audio data chunks as bytes, with the text submitted to synthesis since the previous chunk ("" if none)
         """
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 
@@ -19,6 +19,18 @@ class VectorDatabase(ABC):
     def insert_document(self, text: str) -> None:
         """Insert document into vector database."""
 
+    @abstractmethod
+    def insert_documents(self, texts: List[str]) -> None:
+        """Insert multiple documents into vector database in one batch."""
+
     @abstractmethod
     def search(self, query: np.ndarray, top_k: int = 10) -> List[str]:
         """Search documents in vector database."""
+
+    @abstractmethod
+    def search_cached_response(self, query: np.ndarray, min_similarity: float, max_age_seconds: int) -> Optional[str]:
+        """Search the response of the most similar cached query above a cosine similarity."""
+
+    @abstractmethod
+    def insert_cached_response(self, query: np.ndarray, response: str, max_age_seconds: int) -> None:
+        """Cache the response to a query, deleting cached responses older than the maximum age."""
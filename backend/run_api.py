@@ -10,5 +10,7 @@ if __name__ == "__main__":
         "backend.api.app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        # Uses the libuv based uvloop event loop where installed
+        loop="auto"
     )
\ No newline at end of file
@@ -0,0 +1,30 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add the project root directory to the Python path, so tests import the backend package
+project_root = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(project_root)
+
+
+async def _stream(items):
+    for item in items:
+        yield item
+
+
+async def _collect(stream) -> list:
+    return [item async for item in stream]
+
+
+@pytest.fixture
+def stream():
+    """Turn items into an async generator, e.g. the text chunks of an LLM response."""
+    return _stream
+
+
+@pytest.fixture
+def drain():
+    """Run an async generator to completion in a new event loop, returning everything it yielded."""
+    return lambda async_generator: asyncio.run(_collect(async_generator))
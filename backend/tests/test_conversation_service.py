@@ -0,0 +1,33 @@
+from backend.internal.application.conversation_service import ConversationService
+
+
+def test_no_question_is_a_follow_up_without_history():
+    conversation = ConversationService()
+
+    assert not conversation.is_follow_up("Und warum?")
+    assert not conversation.is_follow_up("ja")
+
+
+def test_short_questions_and_follow_up_openings_are_follow_ups():
+    conversation = ConversationService()
+    conversation.add_to_history("Das Museum wurde 1953 gegründet.")
+
+    assert conversation.is_follow_up("Und warum?")
+    assert conversation.is_follow_up("Wer noch?")
+    assert conversation.is_follow_up("Erzähl mir mehr über die Gründung.")
+    assert conversation.is_follow_up("Das klingt spannend, wer hat es gegründet?")
+
+
+def test_long_questions_stand_on_their_own():
+    conversation = ConversationService()
+    conversation.add_to_history("Das Museum wurde 1953 gegründet.")
+
+    assert not conversation.is_follow_up("Welche Ausstellungen zeigt das Museum gerade?")
+
+
+def test_conversations_do_not_share_history():
+    first = ConversationService()
+    first.add_to_history("Antwort.")
+
+    assert ConversationService().get_recent_history() == []
+    assert first.get_recent_history() == ["Antwort."]
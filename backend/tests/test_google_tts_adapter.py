@@ -0,0 +1,59 @@
+from backend.internal.adapters.driven.google_tts_adapter import GoogleTTSAdapter
+
+
+def test_take_whole_samples_keeps_odd_trailing_byte():
+    buffer = bytearray(b"\x01\x02\x03\x04\x05")
+
+    assert GoogleTTSAdapter._take_whole_samples(buffer) == b"\x01\x02\x03\x04"
+    assert buffer == bytearray(b"\x05")
+
+
+def test_take_whole_samples_empties_aligned_buffer():
+    buffer = bytearray(b"\x01\x02")
+
+    assert GoogleTTSAdapter._take_whole_samples(buffer) == b"\x01\x02"
+    assert buffer == bytearray()
+
+
+def test_take_whole_samples_returns_copy():
+    buffer = bytearray(b"\x01\x02\x03")
+    samples = GoogleTTSAdapter._take_whole_samples(buffer)
+    buffer.extend(b"\x04")
+
+    assert isinstance(samples, bytes)
+    assert samples == b"\x01\x02"
+
+
+def split_text_stream(drain, stream, chunks) -> list:
+    return drain(GoogleTTSAdapter()._split_text_stream(stream(chunks)))
+
+
+def test_split_text_stream_splits_after_sentence_ends(drain, stream):
+    assert split_text_stream(drain, stream, ["Hallo Welt. Wie geht", " es dir?"]) == ["Hallo Welt.", "Wie geht es dir?"]
+
+
+def test_split_text_stream_splits_at_natural_breaks(drain, stream):
+    assert split_text_stream(drain, stream, ["Erstens, zweitens"]) == ["Erstens,", "zweitens"]
+
+
+def test_split_text_stream_prefers_the_last_sentence_end(drain, stream):
+    # The remainder is only split again once more text arrives
+    assert split_text_stream(drain, stream, ["Eins, zwei. Drei, vier"]) == ["Eins, zwei.", "Drei, vier"]
+    assert split_text_stream(drain, stream, ["Eins, zwei. Drei, vier", " fünf"]) == [
+        "Eins, zwei.", "Drei,", "vier fünf"
+    ]
+
+
+def test_split_text_stream_splits_long_text_at_word_boundaries(drain, stream):
+    words = "wort " * 25
+
+    assert split_text_stream(drain, stream, [words, "ende"]) == [words.strip(), "ende"]
+
+
+def test_split_text_stream_waits_for_word_boundaries(drain, stream):
+    assert split_text_stream(drain, stream, ["wort" * 30, "ende"]) == ["wort" * 30 + "ende"]
+
+
+def test_split_text_stream_skips_empty_text(drain, stream):
+    assert split_text_stream(drain, stream, ["", "  ", "Hallo."]) == ["Hallo."]
+    assert split_text_stream(drain, stream, []) == []
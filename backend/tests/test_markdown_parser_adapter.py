@@ -0,0 +1,52 @@
+from backend.internal.adapters.driven.markdown_parser_adapter import MarkdownParserAdapter
+
+
+def extract(content: str) -> list:
+    return MarkdownParserAdapter().extract_text_sections(content)
+
+
+def test_headlines_are_dropped_and_end_sections():
+    assert extract("# Titel\nErster Absatz\nzweite Zeile\n## Abschnitt\nZweiter Absatz") == [
+        "Erster Absatz\nzweite Zeile",
+        "Zweiter Absatz",
+    ]
+
+
+def test_hash_without_whitespace_is_not_a_headline():
+    assert extract("#hashtag ist kein Titel") == ["#hashtag ist kein Titel"]
+
+
+def test_blank_and_whitespace_only_lines_separate_sections():
+    assert extract("Eins\n   \n\t\nZwei\n\nDrei") == ["Eins", "Zwei", "Drei"]
+
+
+def test_skipped_lines_do_not_end_sections():
+    assert extract("Absatz mit\n![Bild](bild.png)\nBild dazwischen") == ["Absatz mit\nBild dazwischen"]
+
+
+def test_special_lines_are_skipped():
+    content = "---\n***\n<!-- Kommentar -->\n[Link](http://x)\n```python\nprint('x')\n```"
+
+    assert extract(content) == ["print('x')"]
+
+
+def test_inline_links_are_kept():
+    assert extract("Text [mit Link](http://y) im Satz") == ["Text [mit Link](http://y) im Satz"]
+
+
+def test_only_table_separators_are_skipped():
+    assert extract("| a | b |\n|---|---|\n| 1 | 2 |") == ["| a | b |\n| 1 | 2 |"]
+
+
+def test_sections_are_stripped_and_empty_content_has_none():
+    assert extract("  Eingerückt  \n") == ["Eingerückt"]
+    assert extract("") == []
+    assert extract("# Nur ein Titel\n\n---") == []
+
+
+def test_parse_content_numbers_sections():
+    document = MarkdownParserAdapter().parse_content("# T\nA\n\nB", "datei.md")
+
+    assert document.source_file == "datei.md"
+    assert [(section.section_number, section.content) for section in document.text_sections] == [(1, "A"), (2, "B")]
+    assert all(section.source_file == "datei.md" for section in document.text_sections)
@@ -0,0 +1,38 @@
+from backend.internal.application.response_cache_service import ResponseCacheService
+
+
+def test_create_key_ignores_case_and_whitespace():
+    assert ResponseCacheService.create_key("  Was ist\n RAG? ") == ResponseCacheService.create_key("was ist rag?")
+
+
+def test_create_key_keeps_punctuation():
+    assert ResponseCacheService.create_key("Was ist RAG?") != ResponseCacheService.create_key("Was ist RAG")
+
+
+def test_get_missing_key_returns_none():
+    assert ResponseCacheService().get("missing") is None
+
+
+def test_put_evicts_least_recently_used_entry():
+    cache = ResponseCacheService(max_entries=2)
+    cache.put("a", ["A."])
+    cache.put("b", ["B."])
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == ["A."]
+    cache.put("c", ["C."])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ["A."]
+    assert cache.get("c") == ["C."]
+
+
+def test_put_replaces_existing_entry():
+    cache = ResponseCacheService(max_entries=2)
+    cache.put("a", ["Alt."])
+    cache.put("b", ["B."])
+    cache.put("a", ["Neu."])
+    cache.put("c", ["C."])
+
+    assert cache.get("a") == ["Neu."]
+    assert cache.get("b") is None
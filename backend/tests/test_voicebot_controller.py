@@ -0,0 +1,43 @@
+import struct
+
+import orjson
+
+from backend.internal.adapters.driving.voicebot_controller import VoicebotController
+
+
+def parse_audio_frame(frame: bytes):
+    (header_length,) = struct.unpack_from('<I', frame)
+    return header_length, orjson.loads(frame[4:4 + header_length]), frame[4 + header_length:]
+
+
+def test_audio_frame_layout():
+    header = VoicebotController._create_audio_message(3, 42, "Hallo.")
+    samples = struct.pack('<3h', 1, -2, 32767)
+
+    header_length, parsed_header, parsed_samples = parse_audio_frame(
+        VoicebotController._create_audio_frame(header, samples))
+
+    assert parsed_header == header
+    assert parsed_samples == samples
+
+
+def test_audio_frame_header_is_padded_to_even_length():
+    # Serialized headers of 7 and 8 bytes
+    for header, expected_length in (({"a": 1}, 8), ({"a": 12}, 8)):
+        header_length, parsed_header, samples = parse_audio_frame(
+            VoicebotController._create_audio_frame(header, b"\x01\x00"))
+
+        assert header_length == expected_length
+        assert parsed_header == header
+        assert samples == b"\x01\x00"
+
+
+def test_audio_message_omits_empty_text():
+    assert "llm_response" not in VoicebotController._create_audio_message(1, 7, "")
+    assert VoicebotController._create_audio_message(1, 7, "Hallo.") == {
+        "type": "audio",
+        "chunk_number": 1,
+        "status": "streaming",
+        "id": 7,
+        "llm_response": "Hallo.",
+    }
@@ -0,0 +1,222 @@
+import pytest
+
+from backend.internal.application.conversation_service import ConversationService
+from backend.internal.application.voicebot_service import VoicebotService
+from backend.internal.domain.models.conversation_context import ConversationContext
+from backend.internal.ports.output.llm_port import LLMPort
+from backend.internal.ports.output.rag_port import RAGPort
+from backend.internal.ports.output.tts_port import TTSPort
+
+
+class FakeRAG(RAGPort):
+    def __init__(self):
+        self.cached_responses = {}
+
+    async def retrieve_relevant_documents(self, query, max_results=5):
+        return ["Dokument"]
+
+    async def calculate_embeddings(self, text):
+        raise NotImplementedError
+
+    async def find_cached_response(self, query):
+        return self.cached_responses.get(query)
+
+    async def cache_response(self, query, response):
+        self.cached_responses[query] = response
+
+
+class FakeLLM(LLMPort):
+    """Answers every prompt with a numbered sentence, recording the prompts."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_response_stream(self, prompt):
+        self.prompts.append(prompt)
+        for chunk in ("Antwort ", "Nummer ", f"{len(self.prompts)}."):
+            yield chunk
+
+
+class ScriptedLLM(LLMPort):
+    """Streams the given chunks, then raises the given error if any."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def generate_response_stream(self, prompt):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+class FakeTTS(TTSPort):
+    async def synthesize_speech_stream(self, text_stream, voice):
+        async for text in text_stream:
+            yield text.encode('utf-8'), text
+
+
+def create_service(llm=None):
+    llm = llm or FakeLLM()
+    service = VoicebotService(speech_recognition=None, rag=FakeRAG(), llm=llm, tts=FakeTTS(),
+                              conversation_service=ConversationService())
+    return service, llm
+
+
+def respond(drain, service, prompt, conversation) -> str:
+    audio_stream = service.generate_streaming_voice_response(prompt, conversation=conversation)
+    return "".join(text for _, text in drain(audio_stream))
+
+
+def test_repeated_question_is_answered_from_cache_across_sessions(drain):
+    service, llm = create_service()
+
+    first = respond(drain, service, "Welche Ausstellungen zeigt das Museum?", service.start_conversation())
+    second = respond(drain, service, "welche  Ausstellungen zeigt das Museum?", service.start_conversation())
+
+    assert first == second == "Antwort Nummer 1."
+    assert len(llm.prompts) == 1
+
+
+def test_repeated_standalone_question_is_answered_from_cache_within_a_session(drain):
+    service, llm = create_service()
+    conversation = service.start_conversation()
+
+    respond(drain, service, "Welche Ausstellungen zeigt das Museum?", conversation)
+    respond(drain, service, "Wann wurde das Museum gegründet?", conversation)
+    repeated = respond(drain, service, "Welche Ausstellungen zeigt das Museum?", conversation)
+
+    assert repeated == "Antwort Nummer 1."
+    assert len(llm.prompts) == 2
+    assert conversation.get_recent_history() == ["Antwort Nummer 1.", "Antwort Nummer 2.", "Antwort Nummer 1."]
+
+
+def test_follow_up_questions_are_answered_within_their_session(drain):
+    service, llm = create_service()
+    first_session = service.start_conversation()
+    second_session = service.start_conversation()
+
+    respond(drain, service, "Welche Ausstellungen zeigt das Museum?", first_session)
+    first_follow_up = respond(drain, service, "Und warum?", first_session)
+    respond(drain, service, "Wann wurde das Museum gegründet?", second_session)
+    second_follow_up = respond(drain, service, "Und warum?", second_session)
+
+    assert first_follow_up == "Antwort Nummer 2."
+    assert second_follow_up == "Antwort Nummer 4."
+    assert "Antwort Nummer 3." in llm.prompts[-1]
+    assert "Antwort Nummer 1." not in llm.prompts[-1]
+
+
+def test_standalone_question_is_answered_from_semantic_cache_later_in_a_session(drain):
+    service, llm = create_service()
+    service.rag.cached_responses["Welche Ausstellungen zeigt das Museum?"] = "Aus dem Cache. Zweiter Satz."
+    conversation = service.start_conversation()
+
+    respond(drain, service, "Wann wurde das Museum gegründet?", conversation)
+    answer = respond(drain, service, "Welche Ausstellungen zeigt das Museum?", conversation)
+
+    assert answer == "Aus dem Cache. Zweiter Satz."
+    assert len(llm.prompts) == 1
+
+
+def test_follow_up_questions_skip_the_semantic_cache(drain):
+    service, llm = create_service()
+    service.rag.cached_responses["Und warum ist das so wichtig?"] = "Antwort einer anderen Sitzung."
+    conversation = service.start_conversation()
+
+    respond(drain, service, "Wann wurde das Museum gegründet?", conversation)
+    answer = respond(drain, service, "Und warum ist das so wichtig?", conversation)
+
+    assert answer == "Antwort Nummer 2."
+    assert set(service.rag.cached_responses) == {"Und warum ist das so wichtig?", "Wann wurde das Museum gegründet?"}
+
+
+def test_empty_responses_are_not_added_to_history(drain):
+    service, _ = create_service(ScriptedLLM(["  "]))
+    conversation = service.start_conversation()
+
+    respond(drain, service, "Welche Ausstellungen zeigt das Museum?", conversation)
+
+    assert conversation.get_recent_history() == []
+
+
+def test_failed_responses_are_neither_cached_nor_added_to_history(drain):
+    service, _ = create_service(ScriptedLLM(["Halber Satz. "], error=ValueError("LLM failed")))
+    conversation = service.start_conversation()
+
+    with pytest.raises(ValueError):
+        respond(drain, service, "Welche Ausstellungen zeigt das Museum?", conversation)
+
+    assert conversation.get_recent_history() == []
+    assert service.response_cache.get(service.response_cache.create_key("Welche Ausstellungen zeigt das Museum?")) is None
+
+
+def test_build_prompt_without_history():
+    context = ConversationContext(user_query="Was ist RAG?", relevant_documents=["Erstes\nDokument", "Zweites"])
+
+    assert VoicebotService._build_prompt_with_context(context) == (
+        "Kontext:\n\n - 'Erstes Dokument'\n - 'Zweites'\n\nFrage: Was ist RAG?"
+    )
+
+
+def test_build_prompt_with_empty_history_and_no_documents():
+    context = ConversationContext(user_query="Hallo", relevant_documents=[], conversation_history=[])
+
+    assert VoicebotService._build_prompt_with_context(context) == "Kontext:\n\n\nFrage: Hallo"
+
+
+def test_build_prompt_with_history_first():
+    context = ConversationContext(user_query="Und warum?", relevant_documents=["Dokument"],
+                                  conversation_history=["Erste Antwort.", "Zweite Antwort."])
+
+    assert VoicebotService._build_prompt_with_context(context) == (
+        "Letzten Antworten:\n- Erste Antwort.\n - Zweite Antwort.\n\n"
+        "Kontext:\n\n - 'Dokument'\n\nFrage: Und warum?"
+    )
+
+
+def test_build_prompt_changes_only_after_the_history():
+    history = ["Erste Antwort."]
+    first = VoicebotService._build_prompt_with_context(
+        ConversationContext(user_query="Frage eins", relevant_documents=["A"], conversation_history=history))
+    second = VoicebotService._build_prompt_with_context(
+        ConversationContext(user_query="Frage zwei", relevant_documents=["B"], conversation_history=history))
+
+    shared_prefix = "Letzten Antworten:\n- Erste Antwort.\n\nKontext:\n"
+    assert first.startswith(shared_prefix) and second.startswith(shared_prefix)
+
+
+def batch_sentences(drain, stream, chunks) -> list:
+    return drain(VoicebotService._batch_sentences(stream(chunks)))
+
+
+def test_batch_sentences_splits_after_sentence_ends(drain, stream):
+    assert batch_sentences(drain, stream, ["Hallo Welt. Wie", " geht es", " dir? Gut"]) == [
+        "Hallo Welt.", " Wie geht es dir?", " Gut"
+    ]
+
+
+def test_batch_sentences_splits_at_last_sentence_end_of_a_chunk(drain, stream):
+    assert batch_sentences(drain, stream, ["Eins. Zwei! Drei"]) == ["Eins. Zwei!", " Drei"]
+
+
+def test_batch_sentences_keeps_short_clauses_together(drain, stream):
+    assert batch_sentences(drain, stream, ["Ja, klar", " doch"]) == ["Ja, klar doch"]
+
+
+def test_batch_sentences_splits_long_clauses_at_natural_breaks(drain, stream):
+    clause = "Dies ist ein ziemlich langer Satzteil,"
+    assert len(clause) > VoicebotService.MIN_CLAUSE_LENGTH
+
+    assert batch_sentences(drain, stream, [clause[:20], clause[20:] + " und weiter"]) == [clause, " und weiter"]
+
+
+def test_batch_sentences_drops_whitespace_only_remainder(drain, stream):
+    assert batch_sentences(drain, stream, ["Hallo. ", " "]) == ["Hallo."]
+
+
+def test_batch_sentences_keeps_text(drain, stream):
+    chunks = ["Das ist, wie man sieht", ", ein längerer Text; er hat", " Pausen: viele. Und", " ein Ende"]
+
+    assert "".join(batch_sentences(drain, stream, chunks)) == "".join(chunks)
@@ -3,7 +3,7 @@ export class AudioPlaybackService {
     
     // Audio playback properties
     private playbackAudioContext: AudioContext | null = null;
-    private audioChunks: number[][] = [];
+    private audioChunks: ArrayLike<number>[] = [];
     private nextPlayTime: number = 0;
     private isStreamingAudio: boolean = false;
     private streamingEnded: boolean = false;
@@ -78,7 +78,7 @@ export class AudioPlaybackService {
         this.nextPlayTime = this.playbackAudioContext.currentTime;
     }
 
-    private async playAudioChunk(chunkData: number[]): Promise<void> {
+    private async playAudioChunk(chunkData: ArrayLike<number>): Promise<void> {
         if (!this.playbackAudioContext) {
             console.error('❌ Playback audio context not initialized');
             return;
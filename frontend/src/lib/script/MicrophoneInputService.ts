@@ -246,16 +246,8 @@ export class MicrophoneInputService {
             this.eventTarget.dispatchEvent(audioLevelEvent);
             window.dispatchEvent(audioLevelEvent);
 
-            // Convert Float32Array to regular array for JSON transmission
-            const pcmArray = Array.from(pcmData);
-
-            // Send PCM data in JSON format as expected by backend
-            const message: WebSocketMessage = {
-                type: 'pcm',
-                data: pcmArray
-            };
-
-            this.wsHandler.sendMessage(message);
+            // Send the raw float32 samples as a binary frame, avoiding JSON encoding of every sample
+            this.wsHandler.sendBinary(pcmData);
         } catch (error) {
             console.error('❌ Error sending PCM data:', error);
         }
@@ -62,9 +62,9 @@ export class TextInputService {
 
     private handleAudioChunk(message: WebSocketMessage): void {
         // Forward audio chunk to audio playback service via custom event
-        // Handle backend format: "chunk" field directly, not nested in "data"
+        // Handle backend format: samples of binary frames in "data", "chunk" field of JSON messages
         const audioData = {
-            chunk: message.data?.chunk || (message as any).chunk || []
+            chunk: message.data instanceof Int16Array ? message.data : message.data?.chunk || (message as any).chunk || []
         };
         
         const customEvent = new CustomEvent('audio-chunk', { 
@@ -15,6 +15,7 @@ export class WebSocketHandler {
     private reconnectAttempts: number = 0;
     private maxReconnectAttempts: number = 5;
     private reconnectDelay: number = 1000;
+    private textDecoder: TextDecoder = new TextDecoder();
 
     constructor(private serverUrl: string) {}
 
@@ -22,6 +23,7 @@ export class WebSocketHandler {
         return new Promise((resolve, reject) => {
             try {
                 this.socket = new WebSocket(this.serverUrl);
+                this.socket.binaryType = 'arraybuffer';
 
                 this.socket.onopen = () => {
                     console.log('🔌 WebSocket connected to backend');
@@ -32,7 +34,9 @@ export class WebSocketHandler {
 
                 this.socket.onmessage = (event) => {
                     try {
-                        const message: WebSocketMessage = JSON.parse(event.data);
+                        const message: WebSocketMessage = event.data instanceof ArrayBuffer
+                            ? this.parseBinaryMessage(event.data)
+                            : JSON.parse(event.data);
                         this.handleMessage(message);
                     } catch (error) {
                         console.error('❌ Error parsing WebSocket message:', error);
@@ -57,6 +61,13 @@ export class WebSocketHandler {
         });
     }
 
+    private parseBinaryMessage(buffer: ArrayBuffer): WebSocketMessage {
+        // Binary frames: header length (uint32 LE), JSON header, raw int16 audio samples as data
+        const headerLength = new DataView(buffer).getUint32(0, true);
+        const header = JSON.parse(this.textDecoder.decode(new Uint8Array(buffer, 4, headerLength)));
+        return { ...header, data: new Int16Array(buffer, 4 + headerLength) };
+    }
+
     private handleMessage(message: WebSocketMessage): void {
         const listeners = this.eventListeners.get(message.type);
         if (listeners) {
@@ -106,6 +117,14 @@ export class WebSocketHandler {
         }
     }
 
+    sendBinary(data: ArrayBufferView): void {
+        if (this.socket && this.isConnected && this.socket.readyState === WebSocket.OPEN) {
+            this.socket.send(data);
+        } else {
+            console.warn('⚠️ Cannot send binary data: WebSocket not connected');
+        }
+    }
+
 
     disconnect(): void {
         if (this.socket) {